@@ -2,6 +2,7 @@
 
 import argparse
 import sys
+from contextlib import closing
 from datetime import date, datetime
 from decimal import Decimal
 from pathlib import Path
@@ -146,6 +147,13 @@ Examples:
         help="Strict mode: abort on first parse error instead of skipping",
     )
 
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=1,
+        help="Parse files in N worker processes; 0 uses one per CPU (default: 1)",
+    )
+
     parser.add_argument(
         "--large-transaction-threshold",
         type=float,
@@ -1707,6 +1715,10 @@ def main() -> int:
         console.print(f"[red]Error: Not a directory: {args.input_dir}[/red]")
         return 1
 
+    if args.jobs < 0:
+        console.print(f"[red]Error: --jobs must be 0 or more, got {args.jobs}[/red]")
+        return 1
+
     # Load configuration
     try:
         config = load_config(
@@ -1802,15 +1814,22 @@ def main() -> int:
 
     # Phase 2: Parse files (progress bar, no prompts)
     files_to_parse = list(file_account_map.keys())
-    with create_progress() as progress:
+    with (
+        create_progress() as progress,
+        closing(
+            detector.iter_parse_files(files_to_parse, max_workers=args.jobs or None)
+        ) as parse_results,
+    ):
         task = progress.add_task("Parsing files...", total=len(files_to_parse))
 
-        for file_path in files_to_parse:
+        for file_path, raw_transactions, parse_error in parse_results:
             account = file_account_map[file_path]
 
             # Parse file
             try:
-                raw_transactions = detector.parse_file(file_path)
+                # Failures are raised here so both paths report them alike
+                if parse_error is not None:
+                    raise parse_error
                 file_txn_count = len(raw_transactions)
                 total_raw_transactions += file_txn_count
 
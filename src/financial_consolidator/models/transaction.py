@@ -16,7 +16,7 @@ class TransactionType(Enum):
     DEBIT = "debit"  # Money out (negative)
 
 
-@dataclass
+@dataclass(slots=True)
 class RawTransaction:
     """Parsed transaction data before normalization.
 
@@ -1,9 +1,13 @@
 """Excel workbook writer for financial consolidation output."""
 
-from decimal import Decimal
+from decimal import ROUND_HALF_UP, Decimal
+from itertools import groupby
+from operator import attrgetter
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from financial_consolidator.config import Config
+from financial_consolidator.models.account import Account
 from financial_consolidator.models.report import PLSummary
 from financial_consolidator.models.transaction import Transaction
 from financial_consolidator.utils.logging_config import get_logger
@@ -11,18 +15,66 @@ from financial_consolidator.utils.sanitize import sanitize_for_csv
 
 logger = get_logger(__name__)
 
+if TYPE_CHECKING:
+    # Private module, used for annotations only so a rename cannot disable
+    # Excel output
+    from openpyxl.worksheet._write_only import WriteOnlyWorksheet
+
 # Import openpyxl
 try:
     from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.formatting.rule import FormulaRule
     from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
     from openpyxl.utils import get_column_letter
     from openpyxl.worksheet.datavalidation import DataValidation
+    from openpyxl.xml import LXML
 
     OPENPYXL_AVAILABLE = True
 except ImportError:
     OPENPYXL_AVAILABLE = False
     Workbook = None  # type: ignore
 
+# Account Summary totals are rounded to this once, after summing
+_CENTS = Decimal("0.01")
+
+# Sort keys built from C-level attribute getters rather than per-call lambdas
+_by_name = attrgetter("name")
+_by_review_priority = attrgetter("confidence_score", "date", "account_name")
+_by_date_description = attrgetter("date", "description", "fingerprint")
+_by_account_name = attrgetter("account_name")
+_by_account_date_description = attrgetter("account_name", "date", "description", "fingerprint")
+
+# All Transactions columns, fetched per row in a single C-level call
+_master_row_fields = attrgetter(
+    "date", "account_name", "description", "category", "subcategory",
+    "amount", "running_balance", "source_file", "is_duplicate", "is_uncategorized",
+    "confidence_score", "matched_pattern", "category_source", "confidence_factors",
+    "fingerprint",
+)
+
+# Excel doesn't allow: * ? / \ [ ] : in sheet names; str.translate drops them in one pass
+_INVALID_SHEET_CHARS = str.maketrans("", "", "*?/\\[]:")
+
+
+class _SanitizedValues(dict[str | None, str | None]):
+    """Memo of sanitize_for_csv() results keyed by the raw value.
+
+    Account names, source files, category names and match metadata repeat
+    across most rows and several sheets, so each distinct value is
+    sanitized once per workbook.
+    """
+
+    def __missing__(self, value: str | None) -> str | None:
+        result = self[value] = sanitize_for_csv(value)
+        return result
+
+
+def _account_sort_key(item: tuple[str, Account]) -> tuple[int, str]:
+    """Sort key for (account_id, Account) config items: display order, then name."""
+    account = item[1]
+    return (account.display_order, account.name)
+
 
 class ExcelWriter:
     """Writes financial data to a multi-sheet Excel workbook.
@@ -66,8 +118,22 @@ class ExcelWriter:
         self.header_fill = PatternFill(
             start_color="4472C4", end_color="4472C4", fill_type="solid"
         )
-        self.money_positive = Font(color="006600")  # Dark green
-        self.money_negative = Font(color="CC0000")  # Dark red
+        # Fonts are immutable, so one instance is shared by every cell using it
+        self.bold_font = Font(bold=True)
+        self.bold12_font = Font(bold=True, size=12)
+        self.title_font = Font(bold=True, size=14)
+        self.bold_italic_font = Font(bold=True, italic=True)
+        self.muted_font = Font(italic=True, color="666666")  # Gray notes / opening balance
+        self.muted_fill = PatternFill("solid", fgColor="F5F5F5")
+        # Confidence score fills shared by All Transactions and Review Queue
+        self.low_conf_fill = PatternFill(start_color="FFCCCC", end_color="FFCCCC", fill_type="solid")  # Red
+        self.med_conf_fill = PatternFill(start_color="FFFFCC", end_color="FFFFCC", fill_type="solid")  # Yellow
+        self.high_conf_fill = PatternFill(start_color="CCFFCC", end_color="CCFFCC", fill_type="solid")  # Green
+        # Currency number format depends only on config, so build the string once
+        self.money_format = self._money_format()
+        # Transaction amounts take their green/red colouring from the number
+        # format itself, so amount cells need no per-cell font
+        self.signed_money_format = self._signed_money_format()
         self.centered = Alignment(horizontal="center")
         self.right_aligned = Alignment(horizontal="right")
         self.thin_border = Border(
@@ -77,6 +143,20 @@ class ExcelWriter:
             bottom=Side(style="thin"),
         )
 
+        # Category ID -> display name, resolved once so per-row lookups are a
+        # single dict.get(). Unknown IDs fall back to the ID itself and empty
+        # IDs map to None, matching the previous per-call lookup.
+        self._cat_name_by_id: dict[str | None, str | None] = {None: None, "": None}
+        self._cat_name_by_id.update(
+            (cat_id, category.name) for cat_id, category in config.categories.items()
+        )
+        # Category ID -> type value (income/expense/transfer); None when the
+        # ID is empty, unknown or the category has no type
+        self._cat_type_by_id: dict[str | None, str | None] = {
+            cat_id: category.category_type.value if category.category_type else None
+            for cat_id, category in config.categories.items()
+        }
+
     def write(
         self,
         output_path: Path,
@@ -93,20 +173,23 @@ class ExcelWriter:
             pl_summary: Pre-computed P&L summary data.
         """
         logger.info(f"Writing Excel workbook to {output_path}")
+        if not LXML:
+            logger.debug("lxml not installed; openpyxl will use its slower standard-library XML writer")
 
-        wb = Workbook()
-        # Remove default sheet
-        if wb.active:
-            wb.remove(wb.active)
+        wb = self._new_workbook()
+        self._sanitized = _SanitizedValues()
 
         # Create sheets
         # Category lookup must come first for VLOOKUP references
         self._unique_category_count = self._create_category_lookup(wb)
         self._create_pl_summary(wb, pl_summary)
-        self._create_master_list(wb, transactions)
-        self._create_review_queue(wb, transactions)
-        self._create_deposits_sheet(wb, transactions)
-        self._create_transfers_sheet(wb, transactions)
+        # All Transactions order, sorted once and shared by the sheets that
+        # list transactions in it or reference its row numbers
+        sorted_txns = sorted(transactions, key=self._txn_sort_key)
+        self._create_master_list(wb, sorted_txns)
+        self._create_review_queue(wb, sorted_txns)
+        self._create_deposits_sheet(wb, sorted_txns)
+        self._create_transfers_sheet(wb, sorted_txns)
         self._create_account_sheets(wb, transactions)
         self._create_account_summary(wb, transactions)
         self._create_category_analysis(wb, transactions)
@@ -117,6 +200,89 @@ class ExcelWriter:
         wb.save(output_path)
         logger.info(f"Excel workbook saved: {output_path}")
 
+    @staticmethod
+    def _new_workbook() -> "Workbook":
+        """Create an empty write-only workbook.
+
+        Write-only sheets stream each appended row straight to the output
+        file instead of keeping every cell in memory. Rows can only be
+        appended in order, and column widths / freeze panes must be set
+        before the first row is appended.
+
+        Dates are appended as plain date values: openpyxl gives each one
+        the shared yyyy-mm-dd format itself. A column or named style would
+        not help, since Excel only applies column styles to cells that
+        have no style of their own.
+
+        Returns:
+            Workbook with no sheets.
+        """
+        return Workbook(write_only=True)
+
+    @staticmethod
+    def _styled_cell(
+        ws: "WriteOnlyWorksheet",
+        value: object = None,
+        font: "Font | None" = None,
+        fill: "PatternFill | None" = None,
+        number_format: str | None = None,
+        alignment: "Alignment | None" = None,
+    ) -> "WriteOnlyCell":
+        """Build a cell for ws.append() with only the given styles applied.
+
+        Args:
+            ws: Worksheet the row will be appended to.
+            value: Cell value.
+            font: Optional font.
+            fill: Optional fill.
+            number_format: Optional number format.
+            alignment: Optional alignment.
+
+        Returns:
+            Styled write-only cell.
+        """
+        cell = WriteOnlyCell(ws, value=value)
+        if font is not None:
+            cell.font = font
+        if fill is not None:
+            cell.fill = fill
+        if number_format is not None:
+            cell.number_format = number_format
+        if alignment is not None:
+            cell.alignment = alignment
+        return cell
+
+    def _append_headers(
+        self,
+        ws: "WriteOnlyWorksheet",
+        headers: list[str],
+        alignment: "Alignment | None" = None,
+    ) -> None:
+        """Append a styled header row.
+
+        Args:
+            ws: Worksheet to append to.
+            headers: Header labels, one per column.
+            alignment: Optional alignment for every header cell.
+        """
+        ws.append([
+            self._styled_cell(ws, header, self.header_font, self.header_fill, alignment=alignment)
+            for header in headers
+        ])
+
+    @staticmethod
+    def _set_column_widths(ws: "WriteOnlyWorksheet", widths: list[int]) -> None:
+        """Set column widths starting at column A.
+
+        Must be called before the first row is appended to a write-only sheet.
+
+        Args:
+            ws: Worksheet to configure.
+            widths: Column widths in order.
+        """
+        for i, width in enumerate(widths, 1):
+            ws.column_dimensions[get_column_letter(i)].width = width
+
     def _create_category_lookup(self, wb: "Workbook") -> int:
         """Create hidden Category Lookup sheet for VLOOKUP and data validation.
 
@@ -128,24 +294,24 @@ class ExcelWriter:
         """
         ws = wb.create_sheet("Category Lookup")
 
+        # Hide the sheet
+        # Use veryHidden to prevent users from unhiding and deleting this sheet,
+        # which would break VLOOKUP formulas in Category Type column
+        ws.sheet_state = "veryHidden"
+
+        # Adjust column widths
+        self._set_column_widths(ws, [30, 15])
+
         # Headers
-        headers = ["Category Name", "Category Type"]
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col, value=header)
-            cell.font = self.header_font
-            cell.fill = self.header_fill
+        self._append_headers(ws, ["Category Name", "Category Type"])
 
         # Get all categories sorted by name
-        categories = sorted(
-            self.config.categories.values(),
-            key=lambda c: c.name
-        )
+        categories = sorted(self.config.categories.values(), key=_by_name)
 
         # Write category data, deduplicating by name for VLOOKUP reliability.
         # Previously excluded subcategories, which broke VLOOKUP when transactions
         # were categorized with subcategory IDs. Now includes all categories but
         # deduplicates by name since VLOOKUP returns the first match.
-        row = 2
         seen_names: set[str] = set()
         for category in categories:
             if category.name in seen_names:
@@ -153,21 +319,10 @@ class ExcelWriter:
                 logger.warning(f"Duplicate category name '{category.name}' in config - VLOOKUP may return wrong type")
                 continue
             seen_names.add(category.name)
-            ws.cell(row=row, column=1, value=category.name)
             cat_type = category.category_type.value if category.category_type else ""
-            ws.cell(row=row, column=2, value=cat_type)
-            row += 1
-
-        # Adjust column widths
-        ws.column_dimensions["A"].width = 30
-        ws.column_dimensions["B"].width = 15
-
-        # Hide the sheet
-        # Use veryHidden to prevent users from unhiding and deleting this sheet,
-        # which would break VLOOKUP formulas in Category Type column
-        ws.sheet_state = "veryHidden"
+            ws.append([category.name, cat_type])
 
-        unique_count = row - 2
+        unique_count = len(seen_names)
         logger.debug(f"Created Category Lookup sheet with {unique_count} categories")
         return unique_count
 
@@ -186,195 +341,156 @@ class ExcelWriter:
         ws = wb.create_sheet("P&L Summary")
         years = pl_summary.years
         num_years = len(years)
+        money_fmt = self.money_format
+
+        # Adjust column widths
+        self._set_column_widths(ws, [40] + [15] * (num_years + 1))
 
         # Column references in All Transactions sheet:
         # F = Amount, D = Category, P = Category Type, Q = Year
         txn_sheet = f"'{self.SHEET_ALL_TRANSACTIONS}'"
 
-        row = 1
+        # Year columns plus the trailing Total column
+        year_cols = [get_column_letter(i + 2) for i in range(num_years)]
+        value_cols = [get_column_letter(i + 2) for i in range(num_years + 1)]
+
+        def section_header(label: str, font: "Font") -> list[object]:
+            cells = [self._styled_cell(ws, label, font)]
+            cells.extend(self._styled_cell(ws, str(year), font) for year in years)
+            cells.append(self._styled_cell(ws, "Total", font))
+            return cells
+
+        def category_row(cat: str, row: int, formula_template: str) -> list[object]:
+            # formula_template is formatted with the row and year of each cell
+            cells: list[object] = [sanitize_for_csv(cat)]
+            for year in years:
+                formula = formula_template.format(row=row, year=year)
+                cells.append(self._styled_cell(ws, formula, number_format=money_fmt))
+            # Total column: sum of year columns
+            total_formula = f"=SUM({year_cols[0]}{row}:{year_cols[-1]}{row})" if year_cols else "=0"
+            cells.append(self._styled_cell(ws, total_formula, number_format=money_fmt))
+            return cells
+
+        def total_row(label: object, start_row: int, end_row: int, font: "Font | None") -> list[object]:
+            cells = [label]
+            for col_letter in value_cols:
+                if start_row <= end_row:
+                    formula = f"=SUM({col_letter}{start_row}:{col_letter}{end_row})"
+                else:
+                    formula = "=0"
+                cells.append(self._styled_cell(ws, formula, font, number_format=money_fmt))
+            return cells
 
         # Report metadata header
-        ws.cell(row=row, column=1, value="REPORT SUMMARY")
-        ws.cell(row=row, column=1).font = Font(bold=True, size=14)
-        row += 1
-        ws.cell(row=row, column=1, value="Period")
-        ws.cell(row=row, column=2, value=pl_summary.period_display)
-        row += 1
-        ws.cell(row=row, column=1, value="Accounts")
-        ws.cell(row=row, column=2, value=pl_summary.accounts_display)
-        row += 2
+        ws.append([self._styled_cell(ws, "REPORT SUMMARY", self.title_font)])
+        ws.append(["Period", pl_summary.period_display])
+        ws.append(["Accounts", pl_summary.accounts_display])
+        ws.append([])
+        row = 5
 
         # Income section header with year columns
-        ws.cell(row=row, column=1, value="INCOME")
-        ws.cell(row=row, column=1).font = Font(bold=True)
-        for i, year in enumerate(years):
-            cell = ws.cell(row=row, column=i + 2, value=str(year))
-            cell.font = Font(bold=True)
-        cell = ws.cell(row=row, column=num_years + 2, value="Total")
-        cell.font = Font(bold=True)
-        income_header_row = row
+        ws.append(section_header("INCOME", self.bold_font))
         row += 1
 
         # Income categories with SUMIFS formulas
+        # SUMIFS: Amount where Category Type = "income", Category = cat, Year = year
+        income_formula = (
+            f"=SUMIFS({txn_sheet}!$F:$F,"
+            f"{txn_sheet}!$P:$P,\"income\","
+            f"{txn_sheet}!$D:$D,A{{row}},"
+            f"{txn_sheet}!$Q:$Q,{{year}})"
+        )
         income_start_row = row
         for cat in pl_summary.all_income_categories:
-            ws.cell(row=row, column=1, value=sanitize_for_csv(cat))
-            for i, year in enumerate(years):
-                # SUMIFS: Amount where Category Type = "income", Category = cat, Year = year
-                formula = (
-                    f"=SUMIFS({txn_sheet}!$F:$F,"
-                    f"{txn_sheet}!$P:$P,\"income\","
-                    f"{txn_sheet}!$D:$D,A{row},"
-                    f"{txn_sheet}!$Q:$Q,{year})"
-                )
-                cell = ws.cell(row=row, column=i + 2, value=formula)
-                cell.number_format = self._money_format()
-            # Total column: sum of year columns
-            year_cols = [get_column_letter(i + 2) for i in range(num_years)]
-            total_formula = f"=SUM({year_cols[0]}{row}:{year_cols[-1]}{row})" if year_cols else "=0"
-            cell = ws.cell(row=row, column=num_years + 2, value=total_formula)
-            cell.number_format = self._money_format()
+            ws.append(category_row(cat, row, income_formula))
             row += 1
         income_end_row = row - 1
 
         # Total Income row (sum of income category rows)
-        ws.cell(row=row, column=1, value="Total Income")
-        ws.cell(row=row, column=1).font = Font(bold=True)
+        ws.append(total_row(
+            self._styled_cell(ws, "Total Income", self.bold_font),
+            income_start_row, income_end_row, self.bold_font,
+        ))
         total_income_row = row
-        for i in range(num_years + 1):
-            col = i + 2
-            col_letter = get_column_letter(col)
-            if income_start_row <= income_end_row:
-                formula = f"=SUM({col_letter}{income_start_row}:{col_letter}{income_end_row})"
-            else:
-                formula = "=0"
-            cell = ws.cell(row=row, column=col, value=formula)
-            cell.font = Font(bold=True)
-            cell.number_format = self._money_format()
+        ws.append([])
         row += 2
 
         # Expense section header with year columns
-        ws.cell(row=row, column=1, value="EXPENSES")
-        ws.cell(row=row, column=1).font = Font(bold=True)
-        for i, year in enumerate(years):
-            cell = ws.cell(row=row, column=i + 2, value=str(year))
-            cell.font = Font(bold=True)
-        cell = ws.cell(row=row, column=num_years + 2, value="Total")
-        cell.font = Font(bold=True)
+        ws.append(section_header("EXPENSES", self.bold_font))
         row += 1
 
         # Expense categories with SUMIFS formulas (negate to show positive)
+        # Negate SUMIFS since expenses are stored as negative amounts
+        expense_formula = (
+            f"=-SUMIFS({txn_sheet}!$F:$F,"
+            f"{txn_sheet}!$P:$P,\"expense\","
+            f"{txn_sheet}!$D:$D,A{{row}},"
+            f"{txn_sheet}!$Q:$Q,{{year}})"
+        )
         expense_start_row = row
         for cat in pl_summary.all_expense_categories:
-            ws.cell(row=row, column=1, value=sanitize_for_csv(cat))
-            for i, year in enumerate(years):
-                # Negate SUMIFS since expenses are stored as negative amounts
-                formula = (
-                    f"=-SUMIFS({txn_sheet}!$F:$F,"
-                    f"{txn_sheet}!$P:$P,\"expense\","
-                    f"{txn_sheet}!$D:$D,A{row},"
-                    f"{txn_sheet}!$Q:$Q,{year})"
-                )
-                cell = ws.cell(row=row, column=i + 2, value=formula)
-                cell.number_format = self._money_format()
-            # Total column
-            year_cols = [get_column_letter(i + 2) for i in range(num_years)]
-            total_formula = f"=SUM({year_cols[0]}{row}:{year_cols[-1]}{row})" if year_cols else "=0"
-            cell = ws.cell(row=row, column=num_years + 2, value=total_formula)
-            cell.number_format = self._money_format()
+            ws.append(category_row(cat, row, expense_formula))
             row += 1
         expense_end_row = row - 1
 
         # Total Expenses row
-        ws.cell(row=row, column=1, value="Total Expenses")
-        ws.cell(row=row, column=1).font = Font(bold=True)
+        ws.append(total_row(
+            self._styled_cell(ws, "Total Expenses", self.bold_font),
+            expense_start_row, expense_end_row, self.bold_font,
+        ))
         total_expense_row = row
-        for i in range(num_years + 1):
-            col = i + 2
-            col_letter = get_column_letter(col)
-            if expense_start_row <= expense_end_row:
-                formula = f"=SUM({col_letter}{expense_start_row}:{col_letter}{expense_end_row})"
-            else:
-                formula = "=0"
-            cell = ws.cell(row=row, column=col, value=formula)
-            cell.font = Font(bold=True)
-            cell.number_format = self._money_format()
+        ws.append([])
         row += 2
 
         # Net income row (Total Income - Total Expenses)
-        ws.cell(row=row, column=1, value="NET INCOME")
-        ws.cell(row=row, column=1).font = Font(bold=True, size=12)
-        for i in range(num_years + 1):
-            col = i + 2
-            col_letter = get_column_letter(col)
+        net_cells: list[object] = [self._styled_cell(ws, "NET INCOME", self.bold12_font)]
+        for col_letter in value_cols:
             formula = f"={col_letter}{total_income_row}-{col_letter}{total_expense_row}"
-            cell = ws.cell(row=row, column=col, value=formula)
-            cell.font = Font(bold=True, size=12)
-            cell.number_format = self._money_format()
+            net_cells.append(self._styled_cell(ws, formula, self.bold12_font, number_format=money_fmt))
+        ws.append(net_cells)
+        ws.append([])
+        ws.append([])
         row += 3
 
         # Transfers memo section
-        ws.cell(row=row, column=1, value="TRANSFERS")
-        ws.cell(row=row, column=1).font = Font(bold=True, italic=True)
-        for i, year in enumerate(years):
-            cell = ws.cell(row=row, column=i + 2, value=str(year))
-            cell.font = Font(bold=True, italic=True)
-        cell = ws.cell(row=row, column=num_years + 2, value="Total")
-        cell.font = Font(bold=True, italic=True)
-        row += 1
-        ws.cell(row=row, column=1, value="(Money moved between accounts - not counted as income or expense)")
-        ws.cell(row=row, column=1).font = Font(italic=True, color="666666")
-        row += 1
+        ws.append(section_header("TRANSFERS", self.bold_italic_font))
+        note = "(Money moved between accounts - not counted as income or expense)"
+        ws.append([self._styled_cell(ws, note, self.muted_font)])
+        row += 2
 
         # Transfer categories with SUMIFS formulas
+        # Transfers: use ABS to show absolute value
+        transfer_formula = (
+            f"=ABS(SUMIFS({txn_sheet}!$F:$F,"
+            f"{txn_sheet}!$P:$P,\"transfer\","
+            f"{txn_sheet}!$D:$D,A{{row}},"
+            f"{txn_sheet}!$Q:$Q,{{year}}))"
+        )
         transfer_start_row = row
         for cat in pl_summary.all_transfer_categories:
-            ws.cell(row=row, column=1, value=sanitize_for_csv(cat))
-            for i, year in enumerate(years):
-                # Transfers: use ABS to show absolute value
-                formula = (
-                    f"=ABS(SUMIFS({txn_sheet}!$F:$F,"
-                    f"{txn_sheet}!$P:$P,\"transfer\","
-                    f"{txn_sheet}!$D:$D,A{row},"
-                    f"{txn_sheet}!$Q:$Q,{year}))"
-                )
-                cell = ws.cell(row=row, column=i + 2, value=formula)
-                cell.number_format = self._money_format()
-            # Total column
-            year_cols = [get_column_letter(i + 2) for i in range(num_years)]
-            total_formula = f"=SUM({year_cols[0]}{row}:{year_cols[-1]}{row})" if year_cols else "=0"
-            cell = ws.cell(row=row, column=num_years + 2, value=total_formula)
-            cell.number_format = self._money_format()
+            ws.append(category_row(cat, row, transfer_formula))
             row += 1
         transfer_end_row = row - 1
 
         # Total Transfers row
-        ws.cell(row=row, column=1, value="Total Transfers")
-        for i in range(num_years + 1):
-            col = i + 2
-            col_letter = get_column_letter(col)
-            if transfer_start_row <= transfer_end_row:
-                formula = f"=SUM({col_letter}{transfer_start_row}:{col_letter}{transfer_end_row})"
-            else:
-                formula = "=0"
-            cell = ws.cell(row=row, column=col, value=formula)
-            cell.number_format = self._money_format()
-
-        # Adjust column widths
-        ws.column_dimensions["A"].width = 40
-        for i in range(num_years + 1):
-            ws.column_dimensions[get_column_letter(i + 2)].width = 15
+        ws.append(total_row("Total Transfers", transfer_start_row, transfer_end_row, None))
 
     def _create_master_list(
-        self, wb: "Workbook", transactions: list[Transaction]
+        self, wb: "Workbook", sorted_txns: list[Transaction]
     ) -> None:
         """Create Master List (All Transactions) sheet.
 
         Args:
             wb: Workbook to add sheet to.
-            transactions: Transaction data.
+            sorted_txns: Transaction data, sorted with _txn_sort_key.
         """
         ws = wb.create_sheet(self.SHEET_ALL_TRANSACTIONS)
+        cat_names = self._cat_name_by_id
+        san = self._sanitized
+
+        # Adjust column widths and freeze header row
+        self._set_column_widths(ws, [12, 25, 40, 20, 20, 12, 12, 25, 12, 15, 10, 20, 12, 40, 18, 14, 8, 10])
+        ws.freeze_panes = "A2"
 
         # Headers with confidence scoring columns, fingerprint, and formula columns
         headers = [
@@ -383,89 +499,70 @@ class ExcelWriter:
             "Confidence", "Matched Pattern", "Category Source", "Confidence Factors",
             "Fingerprint", "Category Type", "Year", "Year-Month"
         ]
+        self._append_headers(ws, headers, self.centered)
 
-        # Write headers
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col, value=header)
-            cell.font = self.header_font
-            cell.fill = self.header_fill
-            cell.alignment = self.centered
-
-        # Sort transactions by date, then account
-        sorted_txns = sorted(
-            transactions, key=self._txn_sort_key
-        )
-
-        # Conditional formatting colors for confidence
-        low_conf_fill = PatternFill(start_color="FFCCCC", end_color="FFCCCC", fill_type="solid")  # Red
-        med_conf_fill = PatternFill(start_color="FFFFCC", end_color="FFFFCC", fill_type="solid")  # Yellow
-        high_conf_fill = PatternFill(start_color="CCFFCC", end_color="CCFFCC", fill_type="solid")  # Green
+        # Header-only sheet (and no category dropdown) when there are no transactions
+        if not sorted_txns:
+            return
 
         # Write data
         for row, txn in enumerate(sorted_txns, 2):
-            ws.cell(row=row, column=1, value=txn.date)
-            ws.cell(row=row, column=2, value=sanitize_for_csv(txn.account_name))
-            ws.cell(row=row, column=3, value=sanitize_for_csv(txn.description))
-            ws.cell(row=row, column=4, value=sanitize_for_csv(self._get_category_name(txn.category)))
-            ws.cell(row=row, column=5, value=sanitize_for_csv(self._get_category_name(txn.subcategory)))
-
-            amount_cell = ws.cell(row=row, column=6, value=float(txn.amount))
-            amount_cell.number_format = self._money_format()
-            if txn.amount < 0:
-                amount_cell.font = self.money_negative
-            else:
-                amount_cell.font = self.money_positive
-
-            if txn.running_balance is not None:
-                balance_cell = ws.cell(row=row, column=7, value=float(txn.running_balance))
-                balance_cell.number_format = self._money_format()
-
-            ws.cell(row=row, column=8, value=sanitize_for_csv(txn.source_file))
-            ws.cell(row=row, column=9, value="Yes" if txn.is_duplicate else "")
-            ws.cell(row=row, column=10, value="Yes" if txn.is_uncategorized else "")
-
-            # Confidence scoring columns
-            if not txn.is_uncategorized:
-                conf_cell = ws.cell(row=row, column=11, value=txn.confidence_score)
-                conf_cell.number_format = "0.00"
-
-                # Apply conditional formatting based on confidence
-                if txn.confidence_score < 0.6:
-                    conf_cell.fill = low_conf_fill
-                elif txn.confidence_score < 0.8:
-                    conf_cell.fill = med_conf_fill
-                else:
-                    conf_cell.fill = high_conf_fill
+            (
+                txn_date, account_name, description, category, subcategory,
+                amount, running_balance, source_file, is_duplicate, is_uncategorized,
+                confidence_score, matched_pattern, category_source, confidence_factors,
+                fingerprint,
+            ) = _master_row_fields(txn)
+
+            amount_cell = self._styled_cell(ws, float(amount), number_format=self.signed_money_format)
+
+            balance_cell = None
+            if running_balance is not None:
+                balance_cell = self._styled_cell(
+                    ws, float(running_balance), number_format=self.money_format
+                )
 
-            ws.cell(row=row, column=12, value=sanitize_for_csv(txn.matched_pattern or ""))
-            ws.cell(row=row, column=13, value=sanitize_for_csv(txn.category_source))
+            # Confidence scoring columns (coloured by conditional formatting below)
+            conf_cell = None
+            if not is_uncategorized:
+                conf_cell = self._styled_cell(ws, confidence_score, number_format="0.00")
 
             # Format confidence factors as semicolon-separated list
-            factors_str = "; ".join(txn.confidence_factors) if txn.confidence_factors else ""
-            ws.cell(row=row, column=14, value=sanitize_for_csv(factors_str))
+            factors_str = "; ".join(confidence_factors) if confidence_factors else ""
 
-            # Fingerprint for correction matching
-            ws.cell(row=row, column=15, value=txn.fingerprint)
-
-            # Category Type formula (VLOOKUP from Category Lookup sheet)
-            # D column = Category, lookup returns type from column B of Category Lookup
-            ws.cell(row=row, column=16, value=f"=IFERROR(VLOOKUP(D{row},'Category Lookup'!$A:$B,2,FALSE),\"\")")
-
-            # Year formula from Date column
-            ws.cell(row=row, column=17, value=f"=YEAR(A{row})")
+            ws.append([
+                txn_date,
+                san[account_name],
+                sanitize_for_csv(description),
+                san[cat_names.get(category, category)],
+                san[cat_names.get(subcategory, subcategory)],
+                amount_cell,
+                balance_cell,
+                san[source_file],
+                "Yes" if is_duplicate else "",
+                "Yes" if is_uncategorized else "",
+                conf_cell,
+                san[matched_pattern or ""],
+                san[category_source],
+                sanitize_for_csv(factors_str),
+                # Fingerprint for correction matching
+                fingerprint,
+                # Category Type formula (VLOOKUP from Category Lookup sheet)
+                # D column = Category, lookup returns type from column B of Category Lookup
+                f"=IFERROR(VLOOKUP(D{row},'Category Lookup'!$A:$B,2,FALSE),\"\")",
+                # Year formula from Date column
+                f"=YEAR(A{row})",
+                # Year-Month formula for Category Analysis (e.g., "2023-01")
+                f"=TEXT(A{row},\"YYYY-MM\")",
+            ])
 
-            # Year-Month formula for Category Analysis (e.g., "2023-01")
-            ws.cell(row=row, column=18, value=f"=TEXT(A{row},\"YYYY-MM\")")
-
-        # Adjust column widths
-        widths = [12, 25, 40, 20, 20, 12, 12, 25, 12, 15, 10, 20, 12, 40, 18, 14, 8, 10]
-        for i, width in enumerate(widths, 1):
-            ws.column_dimensions[get_column_letter(i)].width = width
+        # Confidence colouring for all data rows in one set of rules
+        self._add_confidence_formatting(ws, "K", len(sorted_txns) + 1)
 
         # Add data validation dropdown on Category column (D)
         # Reference unique category names from Category Lookup sheet
         num_categories = getattr(self, '_unique_category_count', len(self.config.categories))
-        if num_categories > 0 and len(sorted_txns) > 0:
+        if num_categories > 0:
             dv = DataValidation(
                 type="list",
                 formula1=f"'Category Lookup'!$A$2:$A${num_categories + 1}",
@@ -478,13 +575,11 @@ class ExcelWriter:
             dv.promptTitle = "Category"
             # Apply to all data rows in the Category column
             dv.add(f"D2:D{len(sorted_txns) + 1}")
-            ws.add_data_validation(dv)
-
-        # Freeze header row
-        ws.freeze_panes = "A2"
+            # Write-only sheets emit validations after the rows, so this can follow the data
+            ws.data_validations.append(dv)
 
     def _create_review_queue(
-        self, wb: "Workbook", transactions: list[Transaction]
+        self, wb: "Workbook", sorted_txns: list[Transaction]
     ) -> None:
         """Create Review Queue sheet sorted by confidence score (lowest first).
 
@@ -494,14 +589,15 @@ class ExcelWriter:
 
         Args:
             wb: Workbook to add sheet to.
-            transactions: Transaction data.
+            sorted_txns: Transaction data, sorted with _txn_sort_key.
         """
         ws = wb.create_sheet("Review Queue")
+        cat_names = self._cat_name_by_id
+        san = self._sanitized
 
-        # Conditional formatting colors for confidence
-        low_conf_fill = PatternFill(start_color="FFCCCC", end_color="FFCCCC", fill_type="solid")
-        med_conf_fill = PatternFill(start_color="FFFFCC", end_color="FFFFCC", fill_type="solid")
-        high_conf_fill = PatternFill(start_color="CCFFCC", end_color="CCFFCC", fill_type="solid")
+        # Adjust column widths and freeze header row
+        self._set_column_widths(ws, [10, 12, 20, 40, 20, 12, 10, 20, 12, 40, 18])
+        ws.freeze_panes = "A2"
 
         # Headers
         headers = [
@@ -509,196 +605,149 @@ class ExcelWriter:
             "Amount", "Confidence", "Matched Pattern", "Category Source",
             "Confidence Factors", "Fingerprint"
         ]
+        self._append_headers(ws, headers, self.centered)
 
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col, value=header)
-            cell.font = self.header_font
-            cell.fill = self.header_fill
-            cell.alignment = self.centered
-
-        # Sort transactions by confidence score (lowest first), then by date
-        # We need to track the original row numbers in All Transactions
-        # All Transactions is sorted by: date, account_name, description
-        sorted_for_master = sorted(
-            transactions, key=self._txn_sort_key
-        )
+        # Header-only sheet when there is nothing to review
+        if not sorted_txns:
+            return
 
-        # Create a mapping of transaction ID to row number in All Transactions.
+        # Create a mapping of transaction ID to row number in All Transactions,
+        # which lists transactions in the same order as sorted_txns.
         # Use txn.id (UUID) for row mapping because identical transactions intentionally
         # share fingerprints (by design for correction matching), but each needs its own
         # row reference in the spreadsheet.
-        txn_row_map = {txn.id: idx + 2 for idx, txn in enumerate(sorted_for_master)}
+        txn_row_map = {txn.id: idx + 2 for idx, txn in enumerate(sorted_txns)}
 
-        # Sort by confidence score (lowest first) for review queue
-        sorted_for_review = sorted(
-            transactions, key=lambda t: (t.confidence_score, t.date, t.account_name)
-        )
+        # Sort by confidence score (lowest first), then by date, for review queue.
+        # The sort is stable, so remaining ties keep All Transactions order.
+        sorted_for_review = sorted(sorted_txns, key=_by_review_priority)
 
         # Write data
-        for row, txn in enumerate(sorted_for_review, 2):
-            # Row number in All Transactions (for reference)
-            all_txn_row = txn_row_map.get(txn.id, "")
-            ws.cell(row=row, column=1, value=all_txn_row)
-
-            ws.cell(row=row, column=2, value=txn.date)
-            ws.cell(row=row, column=3, value=sanitize_for_csv(txn.account_name))
-            ws.cell(row=row, column=4, value=sanitize_for_csv(txn.description))
-            ws.cell(row=row, column=5, value=sanitize_for_csv(self._get_category_name(txn.category)))
-
-            amount_cell = ws.cell(row=row, column=6, value=float(txn.amount))
-            amount_cell.number_format = self._money_format()
-            if txn.amount < 0:
-                amount_cell.font = self.money_negative
-            else:
-                amount_cell.font = self.money_positive
-
-            # Confidence score with conditional formatting
-            conf_cell = ws.cell(row=row, column=7, value=txn.confidence_score)
-            conf_cell.number_format = "0.00"
-            if txn.confidence_score < 0.6:
-                conf_cell.fill = low_conf_fill
-            elif txn.confidence_score < 0.8:
-                conf_cell.fill = med_conf_fill
-            else:
-                conf_cell.fill = high_conf_fill
-
-            ws.cell(row=row, column=8, value=sanitize_for_csv(txn.matched_pattern or ""))
-            ws.cell(row=row, column=9, value=sanitize_for_csv(txn.category_source))
+        for txn in sorted_for_review:
+            amount_cell = self._styled_cell(ws, float(txn.amount), number_format=self.signed_money_format)
 
-            factors_str = "; ".join(txn.confidence_factors) if txn.confidence_factors else ""
-            ws.cell(row=row, column=10, value=sanitize_for_csv(factors_str))
+            # Confidence score (coloured by conditional formatting below)
+            conf_cell = self._styled_cell(ws, txn.confidence_score, number_format="0.00")
 
-            ws.cell(row=row, column=11, value=txn.fingerprint)
+            factors_str = "; ".join(txn.confidence_factors) if txn.confidence_factors else ""
 
-        # Adjust column widths
-        widths = [10, 12, 20, 40, 20, 12, 10, 20, 12, 40, 18]
-        for i, width in enumerate(widths, 1):
-            ws.column_dimensions[get_column_letter(i)].width = width
+            ws.append([
+                # Row number in All Transactions (for reference)
+                txn_row_map.get(txn.id, ""),
+                txn.date,
+                san[txn.account_name],
+                sanitize_for_csv(txn.description),
+                san[cat_names.get(txn.category, txn.category)],
+                amount_cell,
+                conf_cell,
+                san[txn.matched_pattern or ""],
+                san[txn.category_source],
+                sanitize_for_csv(factors_str),
+                txn.fingerprint,
+            ])
 
-        # Freeze header row
-        ws.freeze_panes = "A2"
+        self._add_confidence_formatting(ws, "G", len(sorted_for_review) + 1)
 
-        logger.debug(f"Created Review Queue with {len(transactions)} transactions")
+        logger.debug(f"Created Review Queue with {len(sorted_txns)} transactions")
 
     def _create_deposits_sheet(
-        self, wb: "Workbook", transactions: list[Transaction]
+        self, wb: "Workbook", sorted_txns: list[Transaction]
     ) -> None:
         """Create Deposits sheet showing only positive amount transactions.
 
         Args:
             wb: Workbook to add sheet to.
-            transactions: Transaction data.
+            sorted_txns: Transaction data, sorted with _txn_sort_key.
         """
         ws = wb.create_sheet("Deposits")
+        cat_names = self._cat_name_by_id
+        san = self._sanitized
+
+        # Adjust column widths and freeze header row
+        self._set_column_widths(ws, [12, 25, 40, 20, 20, 12, 12, 25])
+        ws.freeze_panes = "A2"
 
         # Headers
         headers = [
             "Date", "Account", "Description", "Category", "Sub-category",
             "Amount", "Balance", "Source File"
         ]
+        self._append_headers(ws, headers, self.centered)
 
-        # Write headers
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col, value=header)
-            cell.font = self.header_font
-            cell.fill = self.header_fill
-            cell.alignment = self.centered
-
-        # Filter to deposits only (amount > 0, excludes zero and negative)
-        deposits = [txn for txn in transactions if txn.amount > 0]
-
-        # Sort deposits by date, then account, then description
-        sorted_deposits = sorted(
-            deposits, key=self._txn_sort_key
-        )
+        # Filter to deposits only (amount > 0, excludes zero and negative);
+        # filtering keeps the date/account/description order
+        sorted_deposits = [txn for txn in sorted_txns if txn.amount > 0]
 
         # Write data
-        for row, txn in enumerate(sorted_deposits, 2):
-            ws.cell(row=row, column=1, value=txn.date)
-            ws.cell(row=row, column=2, value=sanitize_for_csv(txn.account_name))
-            ws.cell(row=row, column=3, value=sanitize_for_csv(txn.description))
-            ws.cell(row=row, column=4, value=sanitize_for_csv(self._get_category_name(txn.category)))
-            ws.cell(row=row, column=5, value=sanitize_for_csv(self._get_category_name(txn.subcategory)))
-
-            amount_cell = ws.cell(row=row, column=6, value=float(txn.amount))
-            amount_cell.number_format = self._money_format()
-            amount_cell.font = self.money_positive  # Always green since deposits are positive
-
+        for txn in sorted_deposits:
+            balance_cell = None
             if txn.running_balance is not None:
-                balance_cell = ws.cell(row=row, column=7, value=float(txn.running_balance))
-                balance_cell.number_format = self._money_format()
-
-            ws.cell(row=row, column=8, value=sanitize_for_csv(txn.source_file))
-
-        # Adjust column widths
-        widths = [12, 25, 40, 20, 20, 12, 12, 25]
-        for i, width in enumerate(widths, 1):
-            ws.column_dimensions[get_column_letter(i)].width = width
+                balance_cell = self._styled_cell(
+                    ws, float(txn.running_balance), number_format=self.money_format
+                )
 
-        # Freeze header row
-        ws.freeze_panes = "A2"
+            ws.append([
+                txn.date,
+                san[txn.account_name],
+                sanitize_for_csv(txn.description),
+                san[cat_names.get(txn.category, txn.category)],
+                san[cat_names.get(txn.subcategory, txn.subcategory)],
+                # Always green since deposits are positive
+                self._styled_cell(ws, float(txn.amount), number_format=self.signed_money_format),
+                balance_cell,
+                san[txn.source_file],
+            ])
 
     def _create_transfers_sheet(
-        self, wb: "Workbook", transactions: list[Transaction]
+        self, wb: "Workbook", sorted_txns: list[Transaction]
     ) -> None:
         """Create Transfers sheet showing only transfer-type transactions.
 
         Args:
             wb: Workbook to add sheet to.
-            transactions: Transaction data.
+            sorted_txns: Transaction data, sorted with _txn_sort_key.
         """
         ws = wb.create_sheet("Transfers")
+        cat_names = self._cat_name_by_id
+        san = self._sanitized
+
+        # Adjust column widths and freeze header row
+        self._set_column_widths(ws, [12, 25, 40, 20, 20, 12, 12, 25])
+        ws.freeze_panes = "A2"
 
         # Headers
         headers = [
             "Date", "Account", "Description", "Category", "Sub-category",
             "Amount", "Balance", "Source File"
         ]
+        self._append_headers(ws, headers, self.centered)
 
-        # Write headers
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col, value=header)
-            cell.font = self.header_font
-            cell.fill = self.header_fill
-            cell.alignment = self.centered
-
-        # Filter to transfers only (category type == "transfer")
-        transfers = [
-            txn for txn in transactions
-            if self._get_category_type(txn.category) == "transfer"
+        # Filter to transfers only (category type == "transfer");
+        # filtering keeps the date/account/description order
+        sorted_transfers = [
+            txn for txn in sorted_txns
+            if self._cat_type_by_id.get(txn.category) == "transfer"
         ]
 
-        # Sort transfers by date, then account, then description
-        sorted_transfers = sorted(
-            transfers, key=self._txn_sort_key
-        )
-
         # Write data
-        for row, txn in enumerate(sorted_transfers, 2):
-            ws.cell(row=row, column=1, value=txn.date)
-            ws.cell(row=row, column=2, value=sanitize_for_csv(txn.account_name))
-            ws.cell(row=row, column=3, value=sanitize_for_csv(txn.description))
-            ws.cell(row=row, column=4, value=sanitize_for_csv(self._get_category_name(txn.category)))
-            ws.cell(row=row, column=5, value=sanitize_for_csv(self._get_category_name(txn.subcategory)))
-
-            amount_cell = ws.cell(row=row, column=6, value=float(txn.amount))
-            amount_cell.number_format = self._money_format()
-            # Green for positive, red for negative
-            amount_cell.font = self.money_positive if txn.amount >= 0 else self.money_negative
-
+        for txn in sorted_transfers:
+            balance_cell = None
             if txn.running_balance is not None:
-                balance_cell = ws.cell(row=row, column=7, value=float(txn.running_balance))
-                balance_cell.number_format = self._money_format()
-
-            ws.cell(row=row, column=8, value=sanitize_for_csv(txn.source_file))
-
-        # Adjust column widths
-        widths = [12, 25, 40, 20, 20, 12, 12, 25]
-        for i, width in enumerate(widths, 1):
-            ws.column_dimensions[get_column_letter(i)].width = width
+                balance_cell = self._styled_cell(
+                    ws, float(txn.running_balance), number_format=self.money_format
+                )
 
-        # Freeze header row
-        ws.freeze_panes = "A2"
+            ws.append([
+                txn.date,
+                san[txn.account_name],
+                sanitize_for_csv(txn.description),
+                san[cat_names.get(txn.category, txn.category)],
+                san[cat_names.get(txn.subcategory, txn.subcategory)],
+                # Green for positive, red for negative
+                self._styled_cell(ws, float(txn.amount), number_format=self.signed_money_format),
+                balance_cell,
+                san[txn.source_file],
+            ])
 
     def _create_account_sheets(
         self, wb: "Workbook", transactions: list[Transaction]
@@ -709,81 +758,59 @@ class ExcelWriter:
             wb: Workbook to add sheets to.
             transactions: Transaction data.
         """
-        # Group by account
-        by_account: dict[str, list[Transaction]] = {}
-        for txn in transactions:
-            if txn.account_name not in by_account:
-                by_account[txn.account_name] = []
-            by_account[txn.account_name].append(txn)
+        cat_names = self._cat_name_by_id
+        san = self._sanitized
+
+        # Sort once by account, then date with fingerprint tiebreaker for
+        # deterministic ordering, and slice out each account's run of rows
+        sorted_txns = sorted(transactions, key=_by_account_date_description)
 
-        for account_name, account_txns in sorted(by_account.items()):
+        for account_name, group in groupby(sorted_txns, key=_by_account_name):
+            account_txns = list(group)
             # Sanitize and truncate sheet name (Excel limit is 31 chars)
-            # Excel doesn't allow: * ? / \ [ ] in sheet names
-            sheet_name = account_name
-            for char in ['*', '?', '/', '\\', '[', ']', ':']:
-                sheet_name = sheet_name.replace(char, '')
-            sheet_name = sheet_name[:31]
+            sheet_name = account_name.translate(_INVALID_SHEET_CHARS)[:31]
             ws = wb.create_sheet(sheet_name)
 
-            headers = ["Date", "Description", "Category", "Amount", "Balance"]
-
-            for col, header in enumerate(headers, 1):
-                cell = ws.cell(row=1, column=col, value=header)
-                cell.font = self.header_font
-                cell.fill = self.header_fill
+            # Adjust widths and freeze header row
+            self._set_column_widths(ws, [12, 40, 20, 12, 12])
+            ws.freeze_panes = "A2"
 
-            # Track starting row for transactions (2 = after header, 3 = after opening balance)
-            data_start_row = 2
+            self._append_headers(ws, ["Date", "Description", "Category", "Amount", "Balance"])
 
             # Add opening balance row if available
             # Use account_id from first transaction (unique) rather than account_name (not unique)
             account_id = account_txns[0].account_id
             account = self.config.accounts.get(account_id)
             if account and account.opening_balance is not None:
-                # Pass date object directly (not string) for consistent Excel date handling
-                ws.cell(row=2, column=1, value=account.opening_balance_date)
-                ws.cell(row=2, column=2, value="[Opening Balance]")
-                balance_cell = ws.cell(
-                    row=2, column=5, value=float(account.opening_balance)
-                )
-                balance_cell.number_format = self._money_format()
-
                 # Style: italic gray text, light gray background
-                for col in range(1, 6):
-                    cell = ws.cell(row=2, column=col)
-                    cell.font = Font(italic=True, color="666666")
-                    cell.fill = PatternFill("solid", fgColor="F5F5F5")
-
-                data_start_row = 3
-
-            # Sort by date with fingerprint tiebreaker for deterministic ordering
-            sorted_txns = sorted(account_txns, key=lambda t: (t.date, t.description, t.fingerprint))
-
-            for idx, txn in enumerate(sorted_txns):
-                row = data_start_row + idx
-                ws.cell(row=row, column=1, value=txn.date)
-                ws.cell(row=row, column=2, value=sanitize_for_csv(txn.description))
-                ws.cell(row=row, column=3, value=sanitize_for_csv(self._get_category_name(txn.category)))
-
-                amount_cell = ws.cell(row=row, column=4, value=float(txn.amount))
-                amount_cell.number_format = self._money_format()
-                if txn.amount < 0:
-                    amount_cell.font = self.money_negative
-                else:
-                    amount_cell.font = self.money_positive
-
+                # Pass date object directly (not string) for consistent Excel date handling
+                opening_cells = [
+                    self._styled_cell(ws, value, self.muted_font, self.muted_fill)
+                    for value in (account.opening_balance_date, "[Opening Balance]", None, None)
+                ]
+                opening_cells.append(self._styled_cell(
+                    ws,
+                    float(account.opening_balance),
+                    self.muted_font,
+                    self.muted_fill,
+                    number_format=self.money_format,
+                ))
+                ws.append(opening_cells)
+
+            for txn in account_txns:
+                balance_cell = None
                 if txn.running_balance is not None:
-                    balance_cell = ws.cell(row=row, column=5, value=float(txn.running_balance))
-                    balance_cell.number_format = self._money_format()
-
-            # Adjust widths
-            ws.column_dimensions["A"].width = 12
-            ws.column_dimensions["B"].width = 40
-            ws.column_dimensions["C"].width = 20
-            ws.column_dimensions["D"].width = 12
-            ws.column_dimensions["E"].width = 12
-
-            ws.freeze_panes = "A2"
+                    balance_cell = self._styled_cell(
+                        ws, float(txn.running_balance), number_format=self.money_format
+                    )
+
+                ws.append([
+                    txn.date,
+                    sanitize_for_csv(txn.description),
+                    san[cat_names.get(txn.category, txn.category)],
+                    self._styled_cell(ws, float(txn.amount), number_format=self.signed_money_format),
+                    balance_cell,
+                ])
 
     def _create_account_summary(
         self, wb: "Workbook", transactions: list[Transaction]
@@ -798,13 +825,13 @@ class ExcelWriter:
 
         ws = wb.create_sheet("Account Summary")
 
+        # Set column widths and freeze header row
+        self._set_column_widths(ws, [25, 18, 18, 18, 18])
+        ws.freeze_panes = "A2"
+
         # Headers using existing instance variables
         headers = ["Account", "Opening Balance", "Total Credits", "Total Debits", "Closing Balance"]
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col, value=header)
-            cell.font = self.header_font
-            cell.fill = self.header_fill
-            cell.alignment = self.centered
+        self._append_headers(ws, headers, self.centered)
 
         # Group transactions by account_id
         by_account: dict[str, list[Transaction]] = defaultdict(list)
@@ -826,10 +853,7 @@ class ExcelWriter:
         # Sort accounts by display_order, then name
         # Note: We include all accounts (active and inactive) to match behavior of other
         # sheets (All Transactions, P&L Summary, etc.) and avoid financial discrepancies.
-        sorted_accounts = sorted(
-            self.config.accounts.items(),
-            key=lambda x: (x[1].display_order, x[1].name)
-        )
+        sorted_accounts = sorted(self.config.accounts.items(), key=_account_sort_key)
 
         # Warn about accounts with unknown opening balance (check first, build list only if needed)
         if any(acc.opening_balance is None for _, acc in sorted_accounts):
@@ -840,48 +864,43 @@ class ExcelWriter:
                 f"Closing balances may be incorrect. Use 'set-balance' command to set them."
             )
 
-        # Calculate per account
-        for account_id, account in sorted_accounts:
+        # Calculate per account, formatting currency columns (B through E)
+        # as each row is written
+        money_fmt = self.money_format
+        last_data_row = 1  # Header row; tracked locally as rows are appended
+        for row, (account_id, account) in enumerate(sorted_accounts, 2):
             txns = by_account.get(account_id, [])
             opening = account.opening_balance if account.opening_balance is not None else Decimal("0")
-            credits = sum((t.amount for t in txns if t.amount > 0), Decimal("0"))
-            debits = sum((t.amount for t in txns if t.amount < 0), Decimal("0"))
+            # Sum the exact amounts in one pass and round to cents only once
+            # at the end, so sub-cent amounts cannot drift the totals per row
+            credits = Decimal("0")
+            debits = Decimal("0")
+            for t in txns:
+                if t.amount > 0:
+                    credits += t.amount
+                else:
+                    debits += t.amount
+            credits = credits.quantize(_CENTS, rounding=ROUND_HALF_UP)
+            debits = debits.quantize(_CENTS, rounding=ROUND_HALF_UP)
             closing = opening + credits + debits
 
-            ws.append([
-                account.name,
-                float(opening),
-                float(credits),
-                float(debits),
-                float(closing),
+            ws.append([account.name] + [
+                self._styled_cell(ws, float(value), number_format=money_fmt, alignment=self.right_aligned)
+                for value in (opening, credits, debits, closing)
             ])
-
-        # Format currency columns (B through E)
-        money_fmt = self._money_format()
-        for row in ws.iter_rows(min_row=2, min_col=2, max_col=5):
-            for cell in row:
-                cell.number_format = money_fmt
-                cell.alignment = Alignment(horizontal="right")
-
-        # Set column widths
-        ws.column_dimensions["A"].width = 25
-        for col_letter in ["B", "C", "D", "E"]:
-            ws.column_dimensions[col_letter].width = 18
+            last_data_row = row
 
         # Add totals row (only if there are data rows to sum)
-        if ws.max_row > 1:
-            last_row = ws.max_row + 1
-            ws.cell(row=last_row, column=1, value="TOTAL").font = Font(bold=True)
-
-            for col in range(2, 6):
-                col_letter = get_column_letter(col)
-                formula = f"=SUM({col_letter}2:{col_letter}{last_row - 1})"
-                cell = ws.cell(row=last_row, column=col, value=formula)
-                cell.number_format = money_fmt
-                cell.font = Font(bold=True)
-
-        # Freeze header row
-        ws.freeze_panes = "A2"
+        if last_data_row > 1:
+            ws.append([self._styled_cell(ws, "TOTAL", self.bold_font)] + [
+                self._styled_cell(
+                    ws,
+                    f"=SUM({col_letter}2:{col_letter}{last_data_row})",
+                    self.bold_font,
+                    number_format=money_fmt,
+                )
+                for col_letter in ("B", "C", "D", "E")
+            ])
 
     def _create_category_analysis(
         self, wb: "Workbook", transactions: list[Transaction]
@@ -896,74 +915,74 @@ class ExcelWriter:
             transactions: Transaction data.
         """
         ws = wb.create_sheet("Category Analysis")
+        cat_names = self._cat_name_by_id
 
         # Column references in All Transactions sheet:
         # F = Amount, D = Category, R = Year-Month
         txn_sheet = f"'{self.SHEET_ALL_TRANSACTIONS}'"
 
-        # Get unique categories and months from transactions
-        categories: set[str] = set()
-        months: set[str] = set()
-
-        for txn in transactions:
-            cat_name = self._get_category_name(txn.category)
-            if cat_name:
-                categories.add(cat_name)
-            else:
-                categories.add("Uncategorized")
-            months.add(txn.date.strftime("%Y-%m"))
-
-        all_categories = sorted(categories)
-        all_months = sorted(months)
+        # Get unique categories and months from transactions. The grid itself
+        # is SUMIFS formulas, so only the distinct row/column labels are needed:
+        # collect distinct IDs and dates first, then resolve each one once.
+        category_ids = {txn.category for txn in transactions}
+        dates = {txn.date for txn in transactions}
+        # Months are keyed as integers (year * 12 + month - 1), which sort
+        # chronologically and are formatted once per header instead of
+        # calling strftime for every date
+        month_keys = {d.year * 12 + d.month - 1 for d in dates}
+
+        all_categories = sorted(
+            {cat_names.get(cat_id, cat_id) or "Uncategorized" for cat_id in category_ids}
+        )
+        all_months = [f"{key // 12:04d}-{key % 12 + 1:02d}" for key in sorted(month_keys)]
 
         if not all_months or not all_categories:
-            ws.cell(row=1, column=1, value="No transaction data")
+            ws.append(["No transaction data"])
             return
 
-        # Write headers
-        ws.cell(row=1, column=1, value="Category")
-        ws.cell(row=1, column=1).font = self.header_font
-        ws.cell(row=1, column=1).fill = self.header_fill
+        # Adjust widths and freeze the category column and header row. Month
+        # and Total columns use the sheet default width rather than one <col>
+        # entry each; only the category column is widened.
+        ws.sheet_format.defaultColWidth = 12
+        self._set_column_widths(ws, [25])
+        ws.freeze_panes = "B2"
 
-        for col, month in enumerate(all_months, 2):
-            cell = ws.cell(row=1, column=col, value=month)
-            cell.font = self.header_font
-            cell.fill = self.header_fill
+        # Write headers, with a Total column after the months
+        self._append_headers(ws, ["Category", *all_months, "Total"])
 
-        # Total column
-        total_col = len(all_months) + 2
-        ws.cell(row=1, column=total_col, value="Total")
-        ws.cell(row=1, column=total_col).font = self.header_font
-        ws.cell(row=1, column=total_col).fill = self.header_fill
+        # SUMIFS: Amount where Category = cat and Year-Month = month.
+        # Only the row number varies down a column, so split each month's
+        # formula around it once instead of rebuilding it for every cell.
+        month_formulas = [
+            (
+                f"=SUMIFS({txn_sheet}!$F:$F,{txn_sheet}!$D:$D,A",
+                f",{txn_sheet}!$R:$R,\"{month}\")",
+            )
+            for month in all_months
+        ]
+        month_range = (get_column_letter(2), get_column_letter(len(all_months) + 1))
+        # Every grid cell is a formula, so none can be left blank, and the
+        # format has to be on each cell: a column-level style only applies to
+        # cells Excel creates later, not to cells written with their own style.
+        money_fmt = self.money_format
 
-        # Write data with SUMIFS formulas
+        # Write data rows, each assembled as pre-styled cells and appended in one call
         for row, cat_name in enumerate(all_categories, 2):
-            ws.cell(row=row, column=1, value=sanitize_for_csv(cat_name))
-
-            for col, month in enumerate(all_months, 2):
-                # SUMIFS: Amount where Category = cat and Year-Month = month
-                formula = (
-                    f"=SUMIFS({txn_sheet}!$F:$F,"
-                    f"{txn_sheet}!$D:$D,A{row},"
-                    f"{txn_sheet}!$R:$R,\"{month}\")"
+            row_cells: list[object] = [sanitize_for_csv(cat_name)]
+            for prefix, suffix in month_formulas:
+                row_cells.append(
+                    self._styled_cell(ws, f"{prefix}{row}{suffix}", number_format=money_fmt)
                 )
-                cell = ws.cell(row=row, column=col, value=formula)
-                cell.number_format = self._money_format()
 
             # Total column: sum of month columns for this row
-            first_col = get_column_letter(2)
-            last_col = get_column_letter(len(all_months) + 1)
-            total_formula = f"=SUM({first_col}{row}:{last_col}{row})"
-            cell = ws.cell(row=row, column=total_col, value=total_formula)
-            cell.number_format = self._money_format()
-            cell.font = Font(bold=True)
-
-        # Adjust widths
-        ws.column_dimensions["A"].width = 25
-        for i in range(len(all_months) + 1):
-            ws.column_dimensions[get_column_letter(i + 2)].width = 12
+            row_cells.append(self._styled_cell(
+                ws,
+                f"=SUM({month_range[0]}{row}:{month_range[1]}{row})",
+                self.bold_font,
+                number_format=money_fmt,
+            ))
 
-        ws.freeze_panes = "B2"
+            ws.append(row_cells)
 
     def _create_anomalies_sheet(
         self,
@@ -979,93 +998,77 @@ class ExcelWriter:
             date_gaps: Date gap anomalies.
         """
         ws = wb.create_sheet("Anomalies")
+        san = self._sanitized
 
-        # Transaction anomalies
-        ws.cell(row=1, column=1, value="Transaction Anomalies")
-        ws.cell(row=1, column=1).font = Font(bold=True, size=12)
-
-        headers = ["Date", "Account", "Description", "Amount", "Reason"]
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=2, column=col, value=header)
-            cell.font = self.header_font
-            cell.fill = self.header_fill
-
-        row = 3
         anomaly_txns = [t for t in transactions if t.is_anomaly]
-        for txn in sorted(anomaly_txns, key=lambda t: (t.date, t.description, t.fingerprint)):
-            ws.cell(row=row, column=1, value=txn.date)
-            ws.cell(row=row, column=2, value=sanitize_for_csv(txn.account_name))
-            ws.cell(row=row, column=3, value=sanitize_for_csv(txn.description))
+        if not anomaly_txns and not date_gaps:
+            ws.append(["No anomalies detected"])
+            return
 
-            amount_cell = ws.cell(row=row, column=4, value=float(txn.amount))
-            amount_cell.number_format = self._money_format()
+        # Adjust widths
+        self._set_column_widths(ws, [20, 12, 40, 12, 40])
 
-            ws.cell(row=row, column=5, value=sanitize_for_csv("; ".join(txn.anomaly_reasons)))
-            row += 1
+        # Transaction anomalies
+        ws.append([self._styled_cell(ws, "Transaction Anomalies", self.bold12_font)])
+        self._append_headers(ws, ["Date", "Account", "Description", "Amount", "Reason"])
 
-        # Date gap anomalies
-        row += 2
-        ws.cell(row=row, column=1, value="Date Gap Anomalies")
-        ws.cell(row=row, column=1).font = Font(bold=True, size=12)
-        row += 1
+        for txn in sorted(anomaly_txns, key=_by_date_description):
+            ws.append([
+                txn.date,
+                san[txn.account_name],
+                sanitize_for_csv(txn.description),
+                self._styled_cell(ws, float(txn.amount), number_format=self.money_format),
+                sanitize_for_csv("; ".join(txn.anomaly_reasons)),
+            ])
 
-        gap_headers = ["Account", "Start Date", "End Date", "Gap (Days)", "Severity"]
-        for col, header in enumerate(gap_headers, 1):
-            cell = ws.cell(row=row, column=col, value=header)
-            cell.font = self.header_font
-            cell.fill = self.header_fill
-        row += 1
+        # Date gap anomalies
+        ws.append([])
+        ws.append([])
+        ws.append([self._styled_cell(ws, "Date Gap Anomalies", self.bold12_font)])
+        self._append_headers(ws, ["Account", "Start Date", "End Date", "Gap (Days)", "Severity"])
 
         for gap in date_gaps:
-            ws.cell(row=row, column=1, value=str(gap.get("account_id", "")))
-            ws.cell(row=row, column=2, value=gap.get("start_date"))
-            ws.cell(row=row, column=3, value=gap.get("end_date"))
-            ws.cell(row=row, column=4, value=gap.get("gap_days"))
-            ws.cell(row=row, column=5, value=str(gap.get("severity", "")))
-            row += 1
+            ws.append([
+                str(gap.get("account_id", "")),
+                gap.get("start_date"),
+                gap.get("end_date"),
+                gap.get("gap_days"),
+                str(gap.get("severity", "")),
+            ])
 
-        # Adjust widths
-        ws.column_dimensions["A"].width = 20
-        ws.column_dimensions["B"].width = 12
-        ws.column_dimensions["C"].width = 40
-        ws.column_dimensions["D"].width = 12
-        ws.column_dimensions["E"].width = 40
+    def _add_confidence_formatting(self, ws: "WriteOnlyWorksheet", column: str, last_row: int) -> None:
+        """Colour a confidence score column with conditional formatting rules.
 
-    def _get_category_type(self, category_id: str | None) -> str | None:
-        """Get the type (income/expense/transfer) for a category.
+        Red below 0.6, yellow below 0.8, green otherwise. Blank cells
+        (uncategorized transactions) are left unfilled. Rules are evaluated
+        by Excel, so edited scores recolour automatically.
 
         Args:
-            category_id: Category ID.
-
-        Returns:
-            Category type or None.
+            ws: Worksheet to add the rules to.
+            column: Column letter holding confidence scores.
+            last_row: Last data row (data starts at row 2).
         """
-        if not category_id:
-            return None
-
-        category = self.config.categories.get(category_id)
-        if category:
-            return category.category_type.value if category.category_type else None
-
-        return None
+        cell_range = f"{column}2:{column}{last_row}"
+        first = f"{column}2"
+        rules = [
+            (f"AND(ISNUMBER({first}),{first}<0.6)", self.low_conf_fill),
+            (f"AND(ISNUMBER({first}),{first}>=0.6,{first}<0.8)", self.med_conf_fill),
+            (f"AND(ISNUMBER({first}),{first}>=0.8)", self.high_conf_fill),
+        ]
+        for formula, fill in rules:
+            ws.conditional_formatting.add(cell_range, FormulaRule(formula=[formula], fill=fill))
 
-    def _get_category_name(self, category_id: str | None) -> str | None:
-        """Get display name for a category.
+    def _signed_money_format(self) -> str:
+        """Get number format for transaction amounts coloured by sign.
 
-        Args:
-            category_id: Category ID.
+        Color10 is Excel's dark green palette entry; positives and zero
+        render green, negatives red in parentheses.
 
         Returns:
-            Category name or None.
+            Excel number format string.
         """
-        if not category_id:
-            return None
-
-        category = self.config.categories.get(category_id)
-        if category:
-            return category.name
-
-        return category_id
+        symbol = self.output_config.currency_symbol
+        return f'[Color10]{symbol}#,##0.00_);[Red]({symbol}#,##0.00)'
 
     def _money_format(self) -> str:
         """Get number format for money values.
@@ -1,17 +1,41 @@
-"""File parsers for various financial statement formats."""
-
-from financial_consolidator.parsers.base import BaseParser, ParseError
-from financial_consolidator.parsers.csv_parser import CSVParser
-from financial_consolidator.parsers.detector import (
-    FileDetector,
-    detect_parser,
-    discover_files,
-    get_detector,
-    parse_file,
-)
-from financial_consolidator.parsers.excel_parser import ExcelParser
-from financial_consolidator.parsers.ofx_parser import OFXParser
-from financial_consolidator.parsers.pdf_parser import PDFParser
+"""File parsers for various financial statement formats.
+
+Parser classes are imported lazily on first attribute access (PEP 562) so
+that importing this package, e.g. for ``ParseError``, does not pull in
+openpyxl, pdfplumber or ofxparse until a parser is actually needed.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from financial_consolidator.parsers.base import BaseParser, ParseError
+    from financial_consolidator.parsers.csv_parser import CSVParser
+    from financial_consolidator.parsers.detector import (
+        FileDetector,
+        detect_parser,
+        discover_files,
+        get_detector,
+        parse_file,
+    )
+    from financial_consolidator.parsers.excel_parser import ExcelParser
+    from financial_consolidator.parsers.ofx_parser import OFXParser
+    from financial_consolidator.parsers.pdf_parser import PDFParser
+
+# Public name -> defining module
+_LAZY_IMPORTS = {
+    "BaseParser": "financial_consolidator.parsers.base",
+    "ParseError": "financial_consolidator.parsers.base",
+    "CSVParser": "financial_consolidator.parsers.csv_parser",
+    "OFXParser": "financial_consolidator.parsers.ofx_parser",
+    "ExcelParser": "financial_consolidator.parsers.excel_parser",
+    "PDFParser": "financial_consolidator.parsers.pdf_parser",
+    "FileDetector": "financial_consolidator.parsers.detector",
+    "get_detector": "financial_consolidator.parsers.detector",
+    "detect_parser": "financial_consolidator.parsers.detector",
+    "parse_file": "financial_consolidator.parsers.detector",
+    "discover_files": "financial_consolidator.parsers.detector",
+}
 
 __all__ = [
     "BaseParser",
@@ -26,3 +50,18 @@ __all__ = [
     "parse_file",
     "discover_files",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public parser name from its module on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,6 +1,7 @@
 """Abstract base class for file parsers."""
 
 from abc import ABC, abstractmethod
+from itertools import islice
 from pathlib import Path
 
 from financial_consolidator.models.transaction import RawTransaction
@@ -22,6 +23,10 @@ class ParseError(Exception):
         self.file_path = file_path
         super().__init__(message)
 
+    def __reduce__(self) -> tuple[type["ParseError"], tuple[str, Path | None]]:
+        """Keep file_path when the error is pickled, e.g. from a worker process."""
+        return type(self), (self.args[0], self.file_path)
+
 
 class BaseParser(ABC):
     """Abstract base class for all file parsers.
@@ -118,13 +123,10 @@ class BaseParser(ABC):
         Returns:
             List of first N lines.
         """
-        lines = []
+        lines: list[str] = []
         try:
             with open(file_path, encoding="utf-8", errors="replace") as f:
-                for i, line in enumerate(f):
-                    if i >= n_lines:
-                        break
-                    lines.append(line.rstrip("\n\r"))
+                lines = [line.rstrip("\n\r") for line in islice(f, n_lines)]
         except Exception as e:
             logger.warning(f"Could not read first lines of {file_path}: {e}")
         return lines
@@ -2,7 +2,7 @@
 
 import csv
 import re
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass
 from decimal import Decimal
 from pathlib import Path
@@ -10,8 +10,12 @@ from typing import TypedDict
 
 from financial_consolidator.models.transaction import RawTransaction, TransactionType
 from financial_consolidator.parsers.base import BaseParser, ParseError
-from financial_consolidator.utils.date_utils import parse_date
-from financial_consolidator.utils.decimal_utils import parse_amount
+from financial_consolidator.utils.date_utils import (
+    FIXED_DATE_LAYOUTS,
+    parse_date,
+    parse_fixed_date,
+)
+from financial_consolidator.utils.decimal_utils import parse_amount, parse_signed_amount
 from financial_consolidator.utils.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -22,6 +26,21 @@ MAX_CSV_FILE_SIZE = 50 * 1024 * 1024
 # Maximum number of rows to prevent memory exhaustion from many small rows
 MAX_CSV_ROWS = 500_000
 
+# Lines before the header that carry account/statement metadata
+_METADATA_RE = re.compile(
+    r"^(?:account\s*(?:number|#|:)|statement\s*(?:period|date)|as\s*of|downloaded|generated|\s*$)"
+)
+
+# Cells made up only of digits and currency punctuation (data, not header text)
+_NUMERIC_CELL_RE = re.compile(r"^[\d\$\-\.,\(\)]+$")
+
+# Header keywords for auto-detecting column roles (matched anywhere in the name)
+_DATE_HEADER_RE = re.compile(r"date|posted|trans")
+_DESCRIPTION_HEADER_RE = re.compile(r"description|desc|memo|payee|merchant")
+_DEBIT_HEADER_RE = re.compile(r"debit|withdrawal|payment")
+_CREDIT_HEADER_RE = re.compile(r"credit|deposit")
+_BALANCE_HEADER_RE = re.compile(r"balance|bal|running")
+
 
 @dataclass
 class ColumnMapping:
@@ -173,6 +192,11 @@ KNOWN_FORMATS: dict[str, FormatInfo] = {
     },
 }
 
+# Header names of each known format as sets, for matching by intersection
+KNOWN_HEADER_SETS: dict[str, frozenset[str]] = {
+    name: frozenset(format_info["headers"]) for name, format_info in KNOWN_FORMATS.items()
+}
+
 
 class CSVParser(BaseParser):
     """Parser for CSV financial statement files."""
@@ -185,6 +209,9 @@ class CSVParser(BaseParser):
                    If False, log warnings and skip unparseable rows.
         """
         self.strict = strict
+        # Detected formats keyed by (path, mtime_ns, size); can_parse, parse
+        # and detect_institution are each called on the same file
+        self._format_cache: dict[tuple[str, int, int], CSVFormat | None] = {}
 
     @property
     def supported_extensions(self) -> list[str]:
@@ -223,6 +250,24 @@ class CSVParser(BaseParser):
         Raises:
             ParseError: If parsing fails.
         """
+        return list(self.parse_iter(file_path))
+
+    def parse_iter(self, file_path: Path) -> Iterator[RawTransaction]:
+        """Parse a CSV file, yielding raw transactions as rows are read.
+
+        The file checks and format detection run immediately; row-level
+        errors are raised while iterating.
+
+        Args:
+            file_path: Path to the CSV file.
+
+        Returns:
+            Iterator of RawTransaction objects.
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist.
+            ParseError: If the file is too large or its format is unknown.
+        """
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
 
@@ -239,12 +284,36 @@ class CSVParser(BaseParser):
         if fmt is None:
             raise ParseError(f"Could not detect CSV format for {file_path}", file_path)
 
+        return self._iter_transactions(file_path, fmt)
+
+    def _iter_transactions(
+        self, file_path: Path, fmt: CSVFormat
+    ) -> Iterator[RawTransaction]:
+        """Yield a RawTransaction for each parseable data row.
+
+        Args:
+            file_path: Path to the CSV file.
+            fmt: Detected CSV format.
+
+        Yields:
+            RawTransaction objects in file order.
+
+        Raises:
+            ParseError: If a row limit is exceeded, a row fails in strict
+                mode, or the file cannot be read.
+        """
         logger.info(
             f"Parsing {file_path.name} as {fmt.institution or 'generic'} format "
             f"(delimiter={repr(fmt.delimiter)})"
         )
 
-        transactions = []
+        # Per-file values fixed once the format is known, hoisted out of the row loop
+        parse_row = self._parse_row
+        mapping = fmt.column_mapping
+        source_file = file_path.name
+        date_format = fmt.date_format
+
+        transaction_count = 0
         skipped_count = 0
         try:
             with open(file_path, encoding="utf-8", errors="replace", newline="") as f:
@@ -267,13 +336,15 @@ class CSVParser(BaseParser):
                             file_path,
                         )
 
-                    if not row or all(cell.strip() == "" for cell in row):
+                    # Skip empty and whitespace-only rows
+                    if not "".join(row).strip():
                         continue
 
                     try:
-                        txn = self._parse_row(row, fmt.column_mapping, file_path.name)
+                        txn = parse_row(row, mapping, source_file, date_format)
                         if txn:
-                            transactions.append(txn)
+                            transaction_count += 1
+                            yield txn
                         else:
                             skipped_count += 1
                             if self.strict:
@@ -298,10 +369,9 @@ class CSVParser(BaseParser):
         except Exception as e:
             raise ParseError(f"Failed to parse CSV file: {e}", file_path) from e
 
-        logger.info(f"Parsed {len(transactions)} transactions from {file_path.name} ({skipped_count} rows skipped)")
+        logger.info(f"Parsed {transaction_count} transactions from {file_path.name} ({skipped_count} rows skipped)")
         if skipped_count > 0:
             logger.warning(f"{skipped_count} rows could not be parsed in {file_path.name} - use -vv for details")
-        return transactions
 
     def detect_institution(self, file_path: Path) -> str | None:
         """Detect financial institution from CSV content.
@@ -316,6 +386,25 @@ class CSVParser(BaseParser):
         return fmt.institution if fmt else None
 
     def _detect_format(self, file_path: Path) -> CSVFormat | None:
+        """Detect CSV format, reusing the result while the file is unchanged.
+
+        Args:
+            file_path: Path to the CSV file.
+
+        Returns:
+            CSVFormat if detection succeeds, None otherwise.
+        """
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return self._detect_format_uncached(file_path)
+
+        key = (str(file_path), stat.st_mtime_ns, stat.st_size)
+        if key not in self._format_cache:
+            self._format_cache[key] = self._detect_format_uncached(file_path)
+        return self._format_cache[key]
+
+    def _detect_format_uncached(self, file_path: Path) -> CSVFormat | None:
         """Detect CSV format from file content.
 
         Args:
@@ -354,12 +443,12 @@ class CSVParser(BaseParser):
 
         # Try to match known formats - pick the one with most header matches
         col_indices = {h.lower().strip(): i for i, h in enumerate(headers)}
+        header_set = frozenset(col_indices)
 
         best_match: tuple[int, CSVFormat | None] = (0, None)
 
-        for _format_name, format_info in KNOWN_FORMATS.items():
-            known_headers = format_info["headers"]
-            match_count = sum(1 for h in known_headers if h in col_indices)
+        for format_name, format_info in KNOWN_FORMATS.items():
+            match_count = len(KNOWN_HEADER_SETS[format_name] & header_set)
 
             # Require at least date, description, and amount/debit+credit
             if match_count >= 3 and match_count > best_match[0]:
@@ -384,13 +473,13 @@ class CSVParser(BaseParser):
                     ),
                 )
 
-        if best_match[1]:
-            return best_match[1]
-
-        # Fallback: try to auto-detect columns
-        auto_mapping = self._auto_detect_columns(headers, col_indices)
-        if auto_mapping:
-            return CSVFormat(
+        fmt = best_match[1]
+        if fmt is None:
+            # Fallback: try to auto-detect columns
+            auto_mapping = self._auto_detect_columns(headers, col_indices)
+            if not auto_mapping:
+                return None
+            fmt = CSVFormat(
                 delimiter=delimiter,
                 has_header=True,
                 skip_rows=skip_rows,
@@ -398,6 +487,33 @@ class CSVParser(BaseParser):
                 institution=None,
             )
 
+        fmt.date_format = self._detect_date_format(
+            lines[header_row_idx + 1:], delimiter, fmt.column_mapping.date_col
+        )
+        return fmt
+
+    def _detect_date_format(
+        self, data_lines: list[str], delimiter: str, date_col: int
+    ) -> str | None:
+        """Detect a fixed zero-padded date layout from the first data row.
+
+        Args:
+            data_lines: Lines following the header.
+            delimiter: CSV delimiter.
+            date_col: Index of the date column.
+
+        Returns:
+            A FIXED_DATE_LAYOUTS format if the first row's date matches one,
+            None otherwise.
+        """
+        for line in data_lines:
+            if not line.strip():
+                continue
+            date_str = self._safe_get(self._parse_header(line, delimiter), date_col, "")
+            for date_format in FIXED_DATE_LAYOUTS:
+                if parse_fixed_date(date_str, date_format) is not None:
+                    return date_format
+            return None
         return None
 
     def _detect_delimiter(self, lines: list[str]) -> str:
@@ -467,7 +583,7 @@ class CSVParser(BaseParser):
 
         text_count = sum(
             1 for p in parts
-            if p.strip() and not re.match(r"^[\d\$\-\.,\(\)]+$", p.strip())
+            if p.strip() and not _NUMERIC_CELL_RE.match(p.strip())
         )
         keyword_count = sum(
             1 for p in parts
@@ -485,16 +601,7 @@ class CSVParser(BaseParser):
         Returns:
             True if line is metadata.
         """
-        line = line.strip().lower()
-        metadata_patterns = [
-            r"^account\s*(number|#|:)",
-            r"^statement\s*(period|date)",
-            r"^as\s*of",
-            r"^downloaded",
-            r"^generated",
-            r"^\s*$",  # Empty line
-        ]
-        return any(re.match(p, line) for p in metadata_patterns)
+        return _METADATA_RE.match(line.strip().lower()) is not None
 
     def _parse_header(self, line: str, delimiter: str) -> list[str]:
         """Parse header line into column names.
@@ -535,17 +642,12 @@ class CSVParser(BaseParser):
             header_lower = header.lower()
 
             # Date column
-            if date_col is None and any(
-                kw in header_lower for kw in ["date", "posted", "trans"]
-            ):
+            if date_col is None and _DATE_HEADER_RE.search(header_lower):
                 if "description" not in header_lower:
                     date_col = idx
 
             # Description column
-            if desc_col is None and any(
-                kw in header_lower
-                for kw in ["description", "desc", "memo", "payee", "merchant"]
-            ):
+            if desc_col is None and _DESCRIPTION_HEADER_RE.search(header_lower):
                 desc_col = idx
 
             # Amount column (single)
@@ -553,21 +655,15 @@ class CSVParser(BaseParser):
                 amount_col = idx
 
             # Debit column
-            if debit_col is None and any(
-                kw in header_lower for kw in ["debit", "withdrawal", "payment"]
-            ):
+            if debit_col is None and _DEBIT_HEADER_RE.search(header_lower):
                 debit_col = idx
 
             # Credit column
-            if credit_col is None and any(
-                kw in header_lower for kw in ["credit", "deposit"]
-            ):
+            if credit_col is None and _CREDIT_HEADER_RE.search(header_lower):
                 credit_col = idx
 
             # Balance column
-            if balance_col is None and any(
-                kw in header_lower for kw in ["balance", "bal", "running"]
-            ):
+            if balance_col is None and _BALANCE_HEADER_RE.search(header_lower):
                 balance_col = idx
 
         # Validate minimum required columns
@@ -587,7 +683,11 @@ class CSVParser(BaseParser):
         )
 
     def _parse_row(
-        self, row: list[str], mapping: ColumnMapping, source_file: str
+        self,
+        row: list[str],
+        mapping: ColumnMapping,
+        source_file: str,
+        date_format: str | None = None,
     ) -> RawTransaction | None:
         """Parse a single CSV row into a RawTransaction.
 
@@ -595,27 +695,37 @@ class CSVParser(BaseParser):
             row: CSV row as list of values.
             mapping: Column mapping.
             source_file: Source file name.
+            date_format: Fixed date layout detected for the file, tried
+                before the general parse_date patterns.
 
         Returns:
             RawTransaction or None if row should be skipped.
         """
+        # Date and description columns are always mapped, so index them
+        # directly; only short rows need the bounds check
+        row_len = len(row)
+        date_col = mapping.date_col
+        description_col = mapping.description_col
+
         # Get date
-        date_str = self._safe_get(row, mapping.date_col, "")
+        date_str = row[date_col].strip() if date_col < row_len else ""
         if not date_str:
             logger.debug(f"Skipping row in {source_file}: empty date field")
             return None
 
-        try:
-            parsed_date = parse_date(date_str)
-        except ValueError:
-            logger.debug(f"Skipping row in {source_file}: unparseable date '{date_str}'")
-            return None
+        parsed_date = parse_fixed_date(date_str, date_format) if date_format else None
+        if parsed_date is None:
+            try:
+                parsed_date = parse_date(date_str)
+            except ValueError:
+                logger.debug(f"Skipping row in {source_file}: unparseable date '{date_str}'")
+                return None
         if parsed_date is None:
             logger.debug(f"Skipping row in {source_file}: unparseable date '{date_str}'")
             return None
 
         # Get description
-        description = self._safe_get(row, mapping.description_col, "")
+        description = row[description_col].strip() if description_col < row_len else ""
         if not description:
             logger.debug(f"Skipping row in {source_file}: empty description")
             return None
@@ -629,8 +739,7 @@ class CSVParser(BaseParser):
             amount_str = self._safe_get(row, mapping.amount_col, "")
             if amount_str:
                 try:
-                    abs_amount, is_negative = parse_amount(amount_str)
-                    amount = -abs_amount if is_negative else abs_amount
+                    amount = parse_signed_amount(amount_str)
                     # Determine type from sign
                     transaction_type = (
                         TransactionType.CREDIT if amount >= 0 else TransactionType.DEBIT
@@ -681,8 +790,7 @@ class CSVParser(BaseParser):
             balance_str = self._safe_get(row, mapping.balance_col, "")
             if balance_str:
                 try:
-                    abs_balance, is_neg = parse_amount(balance_str)
-                    balance = -abs_balance if is_neg else abs_balance
+                    balance = parse_signed_amount(balance_str)
                 except ValueError:
                     pass
 
@@ -1,5 +1,12 @@
 """File format auto-detection and file discovery module."""
 
+import os
+import pickle
+import threading
+from collections.abc import Iterator, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import closing
+from operator import itemgetter
 from pathlib import Path
 
 from financial_consolidator.models.transaction import RawTransaction
@@ -37,6 +44,16 @@ class FileDetector:
             ExcelParser(),
             PDFParser(),
         ]
+        # Computed once; discover_files tests every directory entry against it
+        self._supported_set = frozenset(
+            ext.lower() for parser in self.parsers for ext in parser.supported_extensions
+        )
+        self._supported_sorted = tuple(sorted(self._supported_set))
+        # Parsers claiming each extension, in priority order
+        self._parsers_by_ext: dict[str, list[BaseParser]] = {}
+        for parser in self.parsers:
+            for ext in parser.supported_extensions:
+                self._parsers_by_ext.setdefault(ext.lower(), []).append(parser)
 
     @property
     def supported_extensions(self) -> list[str]:
@@ -45,10 +62,7 @@ class FileDetector:
         Returns:
             List of supported extensions.
         """
-        extensions: set[str] = set()
-        for parser in self.parsers:
-            extensions.update(parser.supported_extensions)
-        return sorted(extensions)
+        return list(self._supported_sorted)
 
     def discover_files(self, directory: Path) -> list[Path]:
         """Discover all parseable files in a directory.
@@ -63,32 +77,67 @@ class FileDetector:
             logger.warning(f"Directory not found or not a directory: {directory}")
             return []
 
-        files: list[Path] = []
-        supported = set(self.supported_extensions)
+        # (lowercased name, path), so the sort key comes from the DirEntry
+        # name instead of a Path.name lookup per comparison key
+        found: list[tuple[str, Path]] = []
+        supported = self._supported_set
 
         # Resolve the target directory to get its real path
         resolved_directory = directory.resolve()
 
-        for file_path in directory.rglob("*"):
-            if file_path.is_file() and file_path.suffix.lower() in supported:
-                # Check for symlink path traversal - ensure resolved path is within target directory
+        # Walk with os.scandir so file types come from the cached directory
+        # entry; only symlinks need resolve(). Like rglob, symlinked
+        # directories are not descended into, and each directory's files are
+        # visited before its subdirectories.
+        pending = [str(directory)]
+        while pending:
+            current = pending.pop()
+            try:
+                with os.scandir(current) as it:
+                    entries = list(it)
+            except OSError as e:
+                logger.warning(f"Skipping unreadable directory: {current}: {e}")
+                continue
+
+            subdirs: list[str] = []
+            for entry in entries:
                 try:
-                    resolved_path = file_path.resolve()
-                    # Use relative_to() which raises ValueError if path is not relative
-                    # This is safer than string prefix comparison which can be bypassed
-                    resolved_path.relative_to(resolved_directory)
-                except ValueError:
-                    logger.warning(
-                        f"Skipping file outside target directory (symlink traversal): {file_path}"
-                    )
-                    continue
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                        continue
+                    if os.path.splitext(entry.name)[1].lower() not in supported:
+                        continue
+                    is_symlink = entry.is_symlink()
+                    if not entry.is_file(follow_symlinks=is_symlink):
+                        continue
                 except OSError as e:
-                    logger.warning(f"Skipping file with invalid path: {file_path}: {e}")
+                    logger.warning(f"Skipping file with invalid path: {entry.path}: {e}")
                     continue
-                files.append(file_path)
+
+                file_path = Path(entry.path)
+                if is_symlink:
+                    # Check for symlink path traversal - ensure resolved path is within target directory
+                    try:
+                        resolved_path = file_path.resolve()
+                        # Use relative_to() which raises ValueError if path is not relative
+                        # This is safer than string prefix comparison which can be bypassed
+                        resolved_path.relative_to(resolved_directory)
+                    except ValueError:
+                        logger.warning(
+                            f"Skipping file outside target directory (symlink traversal): {file_path}"
+                        )
+                        continue
+                    except OSError as e:
+                        logger.warning(f"Skipping file with invalid path: {file_path}: {e}")
+                        continue
+                found.append((entry.name.lower(), file_path))
+
+            # Reversed so the stack pops subdirectories in scandir order
+            pending.extend(reversed(subdirs))
 
         # Sort by name for consistent ordering
-        files.sort(key=lambda p: p.name.lower())
+        found.sort(key=itemgetter(0))
+        files = [file_path for _, file_path in found]
 
         logger.info(f"Discovered {len(files)} potential files in {directory}")
         return files
@@ -96,8 +145,9 @@ class FileDetector:
     def detect_parser(self, file_path: Path) -> BaseParser | None:
         """Detect the appropriate parser for a file.
 
-        Tries each parser in order and returns the first one
-        that can handle the file.
+        Tries each parser registered for the file's extension in order
+        and returns the first one that can handle the file. Files with an
+        unrecognized extension are offered to every parser.
 
         Args:
             file_path: Path to the file.
@@ -105,7 +155,7 @@ class FileDetector:
         Returns:
             Parser that can handle the file, or None.
         """
-        for parser in self.parsers:
+        for parser in self._candidate_parsers(file_path):
             try:
                 if parser.can_parse(file_path):
                     logger.debug(
@@ -123,6 +173,9 @@ class FileDetector:
     def detect_institution(self, file_path: Path) -> str | None:
         """Detect the financial institution from a file.
 
+        Only the first parser that can handle the file is asked; if its
+        lookup fails, no other parser is tried.
+
         Args:
             file_path: Path to the file.
 
@@ -139,6 +192,18 @@ class FileDetector:
                 )
         return None
 
+    def _candidate_parsers(self, file_path: Path) -> list[BaseParser]:
+        """Return the parsers to try for a file, in priority order.
+
+        Args:
+            file_path: Path to the file.
+
+        Returns:
+            Parsers registered for the file's extension, or every parser
+            if the extension is not recognized.
+        """
+        return self._parsers_by_ext.get(file_path.suffix.lower(), self.parsers)
+
     def parse_file(self, file_path: Path) -> list[RawTransaction]:
         """Parse a single file using the appropriate parser.
 
@@ -162,16 +227,73 @@ class FileDetector:
 
         return parser.parse(file_path)
 
+    def iter_parse_files(
+        self,
+        files: Sequence[Path],
+        max_workers: int | None = 1,
+    ) -> Iterator[tuple[Path, list[RawTransaction] | None, Exception | None]]:
+        """Parse files, yielding each file's outcome in file order.
+
+        Errors are yielded rather than raised, including worker-pool
+        failures, so one bad file does not stop the rest. With several
+        workers, files are parsed ahead of the caller; closing the iterator
+        cancels files that have not started.
+
+        Args:
+            files: Files to parse.
+            max_workers: Number of worker processes. 1 (default) parses in
+                this process; None uses one worker per CPU.
+
+        Yields:
+            Tuple of (file path, transactions, None) on success or
+            (file path, None, exception) on failure.
+        """
+        if max_workers == 1 or len(files) <= 1:
+            for file_path in files:
+                yield (file_path, *_parse_file_safely(self, file_path))
+            return
+
+        executor = ProcessPoolExecutor(max_workers=max_workers)
+        try:
+            futures: list[Future[tuple[list[RawTransaction] | None, Exception | None]]] = []
+            for file_path in files:
+                try:
+                    future = executor.submit(_parse_file_in_worker, file_path, self.strict)
+                except Exception as e:
+                    # The pool broke while files were still being queued
+                    future = Future()
+                    future.set_exception(e)
+                futures.append(future)
+
+            for file_path, future in zip(files, futures, strict=True):
+                try:
+                    result = future.result()
+                except Exception as e:
+                    # A worker died or its result could not be unpickled;
+                    # report it against this file like any other failure
+                    result = (None, e)
+                yield (file_path, *result)
+        finally:
+            executor.shutdown(cancel_futures=True)
+
     def parse_directory(
         self,
         directory: Path,
         strict: bool = False,
+        max_workers: int | None = 1,
     ) -> tuple[list[RawTransaction], list[str], list[str]]:
         """Parse all files in a directory.
 
+        Files can be parsed in worker processes, which pays off when parsing
+        dominates, e.g. PDF and Excel statements. For CSV files, pickling the
+        transactions back to this process costs more than parsing them, so
+        the default stays serial.
+
         Args:
             directory: Directory to process.
             strict: If True, raise on first error. If False, skip failed files.
+            max_workers: Number of worker processes. 1 (default) parses in
+                this process; None uses one worker per CPU.
 
         Returns:
             Tuple of:
@@ -185,32 +307,32 @@ class FileDetector:
         parsed_files: list[str] = []
         errors: list[str] = []
 
-        for file_path in files:
-            try:
-                transactions = self.parse_file(file_path)
-                all_transactions.extend(transactions)
-                parsed_files.append(file_path.name)
-                logger.info(
-                    f"Parsed {len(transactions)} transactions from {file_path.name}"
-                )
-            except ParseError as e:
-                error_msg = f"{file_path.name}: {e}"
-                if strict:
-                    raise ParseError(error_msg, file_path) from e
-                errors.append(error_msg)
-                logger.warning(f"Skipping {file_path.name}: {e}")
-            except FileNotFoundError:
-                error_msg = f"{file_path.name}: File not found"
-                if strict:
-                    raise
-                errors.append(error_msg)
-                logger.warning(error_msg)
-            except Exception as e:
-                error_msg = f"{file_path.name}: Unexpected error: {e}"
-                if strict:
-                    raise ParseError(error_msg, file_path) from e
-                errors.append(error_msg)
-                logger.error(error_msg)
+        with closing(self.iter_parse_files(files, max_workers)) as results:
+            for file_path, transactions, error in results:
+                if error is None and transactions is not None:
+                    all_transactions.extend(transactions)
+                    parsed_files.append(file_path.name)
+                    logger.info(
+                        f"Parsed {len(transactions)} transactions from {file_path.name}"
+                    )
+                elif isinstance(error, ParseError):
+                    error_msg = f"{file_path.name}: {error}"
+                    if strict:
+                        raise ParseError(error_msg, file_path) from error
+                    errors.append(error_msg)
+                    logger.warning(f"Skipping {file_path.name}: {error}")
+                elif isinstance(error, FileNotFoundError):
+                    error_msg = f"{file_path.name}: File not found"
+                    if strict:
+                        raise error
+                    errors.append(error_msg)
+                    logger.warning(error_msg)
+                else:
+                    error_msg = f"{file_path.name}: Unexpected error: {error}"
+                    if strict:
+                        raise ParseError(error_msg, file_path) from error
+                    errors.append(error_msg)
+                    logger.error(error_msg)
 
         logger.info(
             f"Parsed {len(all_transactions)} total transactions from "
@@ -220,14 +342,57 @@ class FileDetector:
         return all_transactions, parsed_files, errors
 
 
-# Singleton instance for convenience
-_detector: FileDetector | None = None
+def _parse_file_safely(
+    detector: FileDetector, file_path: Path
+) -> tuple[list[RawTransaction] | None, Exception | None]:
+    """Parse a file, returning the exception instead of raising it.
+
+    Args:
+        detector: Detector to parse with.
+        file_path: Path to the file.
+
+    Returns:
+        Tuple of (transactions, None) on success or (None, exception).
+    """
+    try:
+        return detector.parse_file(file_path), None
+    except Exception as e:
+        return None, e
+
+
+def _parse_file_in_worker(
+    file_path: Path, strict: bool
+) -> tuple[list[RawTransaction] | None, Exception | None]:
+    """Parse one file in a worker process for FileDetector.iter_parse_files.
+
+    Args:
+        file_path: Path to the file.
+        strict: Parser strictness of the calling detector.
+
+    Returns:
+        Tuple of (transactions, None) on success or (None, exception).
+    """
+    transactions, error = _parse_file_safely(get_detector(strict), file_path)
+    if error is not None:
+        # An exception that cannot be rebuilt from its pickle would break
+        # the pool when the parent unpickles it, so send its text instead
+        try:
+            pickle.loads(pickle.dumps(error))
+        except Exception:
+            error = Exception(f"{type(error).__name__}: {error}")
+    return transactions, error
+
+
+# Shared instances for convenience, one per strict setting
+_detectors: dict[bool, FileDetector] = {}
+_detectors_lock = threading.Lock()
 
 
 def get_detector(strict: bool = False) -> FileDetector:
-    """Get or create a FileDetector instance.
+    """Get or create the shared FileDetector for a strict setting.
 
-    Note: The singleton is recreated if strict mode differs from current instance.
+    One instance is kept per strict value, so callers alternating between
+    modes reuse their parsers instead of rebuilding them.
 
     Args:
         strict: If True, parsers will raise on row-level parse errors.
@@ -235,10 +400,12 @@ def get_detector(strict: bool = False) -> FileDetector:
     Returns:
         FileDetector instance.
     """
-    global _detector
-    if _detector is None or _detector.strict != strict:
-        _detector = FileDetector(strict=strict)
-    return _detector
+    with _detectors_lock:
+        detector = _detectors.get(strict)
+        if detector is None:
+            detector = FileDetector(strict=strict)
+            _detectors[strict] = detector
+        return detector
 
 
 def detect_parser(file_path: Path) -> BaseParser | None:
@@ -1,14 +1,17 @@
-"""Excel parser using openpyxl library."""
+"""Excel parser using python-calamine, falling back to openpyxl."""
 
-from collections.abc import Sequence
+import functools
+import re
+from collections.abc import Iterable, Iterator, Sequence
 from datetime import date, datetime
 from decimal import Decimal
+from itertools import chain, islice
 from pathlib import Path
 
 from financial_consolidator.models.transaction import RawTransaction, TransactionType
 from financial_consolidator.parsers.base import BaseParser, ParseError
 from financial_consolidator.utils.date_utils import parse_date
-from financial_consolidator.utils.decimal_utils import parse_amount
+from financial_consolidator.utils.decimal_utils import parse_signed_amount
 from financial_consolidator.utils.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -24,9 +27,44 @@ except ImportError:
     load_workbook = None  # type: ignore
     Worksheet = None  # type: ignore
 
+# python-calamine reads workbooks in Rust, much faster than openpyxl
+try:
+    from python_calamine import CalamineWorkbook
+
+    CALAMINE_AVAILABLE = True
+except ImportError:
+    CALAMINE_AVAILABLE = False
+    CalamineWorkbook = None  # type: ignore
+
 # Maximum Excel file size to prevent memory exhaustion (50 MB)
 MAX_EXCEL_FILE_SIZE = 50 * 1024 * 1024
 
+# Leading bytes of a zip (.xlsx) and an OLE2 compound (.xls) file
+XLSX_SIGNATURE = b"PK\x03\x04"
+XLS_SIGNATURE = b"\xd0\xcf\x11\xe0"
+
+# Number of leading rows searched for the header row
+HEADER_SEARCH_ROWS = 20
+
+# Row errors listed in a sheet's summary warning
+MAX_REPORTED_ROW_ERRORS = 5
+
+# Text dates repeat across the rows of a statement, so remember recent ones;
+# parse_date is pure and its results (dates) are immutable
+_parse_date_cached = functools.lru_cache(maxsize=4096)(parse_date)
+
+# Any header keyword, for spotting the header row (matched anywhere in a cell)
+_HEADER_KEYWORD_RE = re.compile(
+    r"date|description|amount|debit|credit|balance|transaction|posted|memo|check|type|category"
+)
+
+# Header keywords for mapping column roles
+_DATE_HEADER_RE = re.compile(r"date|posted|trans")
+_DESCRIPTION_HEADER_RE = re.compile(r"description|desc|memo|payee|merchant|name")
+_DEBIT_HEADER_RE = re.compile(r"debit|withdrawal|payment")
+_CREDIT_HEADER_RE = re.compile(r"credit|deposit")
+_BALANCE_HEADER_RE = re.compile(r"balance|bal|running")
+
 
 class ExcelParser(BaseParser):
     """Parser for Excel financial statement files.
@@ -49,21 +87,25 @@ class ExcelParser(BaseParser):
         Returns:
             True if file is a parseable Excel file.
         """
-        if not OPENPYXL_AVAILABLE:
+        if not CALAMINE_AVAILABLE and not OPENPYXL_AVAILABLE:
             logger.warning("openpyxl library not installed, Excel parsing unavailable")
             return False
 
         if not self._check_extension(file_path):
             return False
 
-        # Try to open the file to verify it's a valid Excel file
+        # Check the container signature rather than opening the workbook
+        # twice; parse() reports files that fail to load
         try:
-            wb = load_workbook(file_path, read_only=True, data_only=True)
-            wb.close()
-            return True
-        except Exception:
+            with file_path.open("rb") as f:
+                signature = f.read(8)
+        except OSError:
             return False
 
+        if file_path.suffix.lower() == ".xls":
+            return signature.startswith(XLS_SIGNATURE)
+        return signature.startswith(XLSX_SIGNATURE)
+
     def parse(self, file_path: Path) -> list[RawTransaction]:
         """Parse an Excel file and return raw transactions.
 
@@ -76,14 +118,17 @@ class ExcelParser(BaseParser):
         Raises:
             ParseError: If parsing fails.
         """
-        if not OPENPYXL_AVAILABLE:
+        if not CALAMINE_AVAILABLE and not OPENPYXL_AVAILABLE:
             raise ParseError("openpyxl library not installed", file_path)
 
-        if not file_path.exists():
-            raise FileNotFoundError(f"File not found: {file_path}")
+        # One stat serves both the existence check and the size limit
+        try:
+            stat = file_path.stat()
+        except (FileNotFoundError, NotADirectoryError):
+            raise FileNotFoundError(f"File not found: {file_path}") from None
 
         # Check file size to prevent memory exhaustion
-        file_size = file_path.stat().st_size
+        file_size = stat.st_size
         if file_size > MAX_EXCEL_FILE_SIZE:
             raise ParseError(
                 f"File too large ({file_size / 1024 / 1024:.1f} MB). "
@@ -95,16 +140,10 @@ class ExcelParser(BaseParser):
 
         transactions = []
         try:
-            wb = load_workbook(file_path, read_only=True, data_only=True)
-
-            # Process each worksheet
-            for sheet_name in wb.sheetnames:
-                sheet = wb[sheet_name]
-                sheet_txns = self._parse_worksheet(sheet, file_path.name, sheet_name)
-                transactions.extend(sheet_txns)
-
-            wb.close()
-
+            if CALAMINE_AVAILABLE:
+                transactions = self._parse_with_calamine(file_path)
+            else:
+                transactions = self._parse_with_openpyxl(file_path)
         except Exception as e:
             raise ParseError(f"Failed to parse Excel file: {e}", file_path) from e
 
@@ -124,13 +163,62 @@ class ExcelParser(BaseParser):
         # For now, return None
         return None
 
+    def _parse_with_calamine(self, file_path: Path) -> list[RawTransaction]:
+        """Parse every worksheet using python-calamine.
+
+        Args:
+            file_path: Path to the Excel file.
+
+        Returns:
+            List of RawTransaction objects.
+        """
+        transactions: list[RawTransaction] = []
+        wb = CalamineWorkbook.from_path(str(file_path))
+        try:
+            for sheet_name in wb.sheet_names:
+                sheet = wb.get_sheet_by_name(sheet_name)
+                # Rows are padded from A1 but columns start at the first used one
+                first_col = sheet.start[1] if sheet.start else 0
+                rows = _calamine_rows(sheet.iter_rows(), first_col)
+                transactions.extend(
+                    self._parse_worksheet(rows, file_path.name, sheet_name)
+                )
+        finally:
+            wb.close()
+        return transactions
+
+    def _parse_with_openpyxl(self, file_path: Path) -> list[RawTransaction]:
+        """Parse every worksheet using openpyxl.
+
+        Args:
+            file_path: Path to the Excel file.
+
+        Returns:
+            List of RawTransaction objects.
+        """
+        transactions: list[RawTransaction] = []
+        wb = load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            for sheet_name in wb.sheetnames:
+                sheet = wb[sheet_name]
+                rows = sheet.iter_rows(values_only=True)
+                transactions.extend(
+                    self._parse_worksheet(rows, file_path.name, sheet_name)
+                )
+        finally:
+            wb.close()
+        return transactions
+
     def _parse_worksheet(
-        self, sheet: "Worksheet", source_file: str, sheet_name: str
+        self,
+        rows: Iterable[tuple[object, ...]],
+        source_file: str,
+        sheet_name: str,
     ) -> list[RawTransaction]:
         """Parse a single worksheet.
 
         Args:
-            sheet: Excel worksheet.
+            rows: Worksheet rows as tuples of cell values.
             source_file: Source file name.
             sheet_name: Name of the worksheet.
 
@@ -139,19 +227,20 @@ class ExcelParser(BaseParser):
         """
         transactions: list[RawTransaction] = []
 
-        # Read all rows
-        rows = list(sheet.iter_rows(values_only=True))
-        if not rows:
+        # Buffer only the rows header detection looks at; the rest stream
+        row_iter = iter(rows)
+        head = list(islice(row_iter, HEADER_SEARCH_ROWS))
+        if not head:
             return transactions
 
         # Find header row
-        header_row_idx = self._find_header_row(rows)
+        header_row_idx = self._find_header_row(head)
         if header_row_idx is None:
             logger.warning(f"No header row found in sheet '{sheet_name}'")
             return transactions
 
         headers = [
-            str(h).lower().strip() if h else "" for h in rows[header_row_idx]
+            str(h).lower().strip() if h else "" for h in head[header_row_idx]
         ]
 
         # Detect column mapping
@@ -160,9 +249,11 @@ class ExcelParser(BaseParser):
             logger.warning(f"Could not detect column mapping in sheet '{sheet_name}'")
             return transactions
 
-        # Parse data rows
-        for row_num, row in enumerate(rows[header_row_idx + 1 :], start=1):
-            if not row or all(cell is None or str(cell).strip() == "" for cell in row):
+        # Parse data rows; failures are reported together once the sheet is done
+        row_errors: list[tuple[int, Exception]] = []
+        data_rows = chain(head[header_row_idx + 1 :], row_iter)
+        for row_num, row in enumerate(data_rows, start=1):
+            if not row or _row_is_empty(row):
                 continue
 
             try:
@@ -170,9 +261,17 @@ class ExcelParser(BaseParser):
                 if txn:
                     transactions.append(txn)
             except Exception as e:
-                logger.warning(
-                    f"Error parsing row {row_num} in sheet '{sheet_name}': {e}"
-                )
+                row_errors.append((row_num, e))
+
+        if row_errors:
+            shown = "; ".join(
+                f"row {row_num}: {e}" for row_num, e in row_errors[:MAX_REPORTED_ROW_ERRORS]
+            )
+            more = len(row_errors) - MAX_REPORTED_ROW_ERRORS
+            logger.warning(
+                f"Skipped {len(row_errors)} rows with errors in sheet '{sheet_name}': "
+                f"{shown}{f' (and {more} more)' if more > 0 else ''}"
+            )
 
         return transactions
 
@@ -182,32 +281,23 @@ class ExcelParser(BaseParser):
         """Find the header row in the worksheet.
 
         Args:
-            rows: All rows from the worksheet.
+            rows: Leading rows from the worksheet.
 
         Returns:
             Index of header row or None.
         """
-        header_keywords = [
-            "date", "description", "amount", "debit", "credit", "balance",
-            "transaction", "posted", "memo", "check", "type", "category",
-        ]
-
-        for i, row in enumerate(rows[:20]):  # Check first 20 rows
+        for i, row in enumerate(rows[:HEADER_SEARCH_ROWS]):
             if not row:
                 continue
 
-            # Count keyword matches
-            text_cells = [
-                str(cell).lower() for cell in row if cell is not None
-            ]
-            keyword_matches = sum(
-                1 for cell in text_cells
-                if any(kw in cell for kw in header_keywords)
-            )
-
-            # If at least 2 keywords match, this is likely the header
-            if keyword_matches >= 2:
-                return i
+            # If at least 2 cells match a keyword, this is likely the header;
+            # stop counting as soon as the second one is seen
+            keyword_matches = 0
+            for cell in row:
+                if cell is not None and _HEADER_KEYWORD_RE.search(str(cell).lower()):
+                    keyword_matches += 1
+                    if keyword_matches >= 2:
+                        return i
 
         return None
 
@@ -229,17 +319,12 @@ class ExcelParser(BaseParser):
                 continue
 
             # Date column
-            if "date" not in mapping and any(
-                kw in header for kw in ["date", "posted", "trans"]
-            ):
+            if "date" not in mapping and _DATE_HEADER_RE.search(header):
                 if "description" not in header:
                     mapping["date"] = i
 
             # Description column
-            if "description" not in mapping and any(
-                kw in header
-                for kw in ["description", "desc", "memo", "payee", "merchant", "name"]
-            ):
+            if "description" not in mapping and _DESCRIPTION_HEADER_RE.search(header):
                 mapping["description"] = i
 
             # Amount column (single)
@@ -247,21 +332,15 @@ class ExcelParser(BaseParser):
                 mapping["amount"] = i
 
             # Debit column
-            if "debit" not in mapping and any(
-                kw in header for kw in ["debit", "withdrawal", "payment"]
-            ):
+            if "debit" not in mapping and _DEBIT_HEADER_RE.search(header):
                 mapping["debit"] = i
 
             # Credit column
-            if "credit" not in mapping and any(
-                kw in header for kw in ["credit", "deposit"]
-            ):
+            if "credit" not in mapping and _CREDIT_HEADER_RE.search(header):
                 mapping["credit"] = i
 
             # Balance column
-            if "balance" not in mapping and any(
-                kw in header for kw in ["balance", "bal", "running"]
-            ):
+            if "balance" not in mapping and _BALANCE_HEADER_RE.search(header):
                 mapping["balance"] = i
 
             # Category column
@@ -357,28 +436,16 @@ class ExcelParser(BaseParser):
 
         # Get optional fields
         balance: Decimal | None = None
-        if "balance" in mapping:
-            balance_val = self._safe_get(row, mapping["balance"])
-            if balance_val is not None:
-                balance = self._parse_amount_value(balance_val)
-
-        category = None
-        if "category" in mapping:
-            cat_val = self._safe_get(row, mapping["category"])
-            if cat_val:
-                category = str(cat_val).strip()
-
-        check_number = None
-        if "check" in mapping:
-            check_val = self._safe_get(row, mapping["check"])
-            if check_val:
-                check_number = str(check_val).strip()
-
-        memo = None
-        if "memo" in mapping:
-            memo_val = self._safe_get(row, mapping["memo"])
-            if memo_val:
-                memo = str(memo_val).strip()
+        balance_val = self._safe_get(row, mapping.get("balance"))
+        if balance_val is not None:
+            balance = self._parse_amount_value(balance_val)
+
+        cat_val = self._safe_get(row, mapping.get("category"))
+        category = str(cat_val).strip() if cat_val else None
+        check_val = self._safe_get(row, mapping.get("check"))
+        check_number = str(check_val).strip() if check_val else None
+        memo_val = self._safe_get(row, mapping.get("memo"))
+        memo = str(memo_val).strip() if memo_val else None
 
         return RawTransaction(
             date=parsed_date,
@@ -392,7 +459,7 @@ class ExcelParser(BaseParser):
             memo=memo,
             raw_data={
                 "sheet_name": sheet_name,
-                "row": [str(v) if v is not None else None for v in row],
+                "row": row,
                 "source": "excel",
             },
         )
@@ -434,7 +501,7 @@ class ExcelParser(BaseParser):
 
         # Try parsing as string
         try:
-            return parse_date(str(value))
+            return _parse_date_cached(str(value))
         except Exception:
             return None
 
@@ -450,7 +517,10 @@ class ExcelParser(BaseParser):
         if value is None:
             return None
 
-        # Handle numeric values directly
+        # Integers convert exactly; floats go through their shortest repr so
+        # a cell holding 3.1 gives Decimal("3.1"), not its binary expansion
+        if type(value) is int:
+            return Decimal(value)
         if isinstance(value, (int, float)):
             return Decimal(str(value))
 
@@ -459,7 +529,50 @@ class ExcelParser(BaseParser):
 
         # Try parsing as string
         try:
-            abs_amount, is_negative = parse_amount(str(value))
-            return -abs_amount if is_negative else abs_amount
+            return parse_signed_amount(str(value))
         except Exception:
             return None
+
+
+def _row_is_empty(row: tuple[object, ...]) -> bool:
+    """Check whether a worksheet row has no content.
+
+    Only strings can be blank, so numbers and dates are never passed
+    through str().
+
+    Args:
+        row: Row tuple of cell values.
+
+    Returns:
+        True if every cell is None or a blank string.
+    """
+    return all(
+        cell is None or (isinstance(cell, str) and not cell.strip()) for cell in row
+    )
+
+
+def _calamine_rows(
+    rows: Iterable[list[object]], first_col: int = 0
+) -> Iterator[tuple[object, ...]]:
+    """Convert python-calamine rows to the values openpyxl would return.
+
+    calamine reports empty cells as "" and every number as a float; map
+    them back to None and, for whole numbers, int so check numbers and
+    amounts read the same with either backend.
+
+    Args:
+        rows: Rows from CalamineSheet.iter_rows().
+        first_col: Index of the first used column, restored as leading
+            empty cells so column positions match the sheet.
+
+    Yields:
+        Row tuples of cell values.
+    """
+    pad = (None,) * first_col
+    for row in rows:
+        yield pad + tuple(
+            None if cell == "" else
+            int(cell) if type(cell) is float and cell.is_integer() else
+            cell
+            for cell in row
+        )
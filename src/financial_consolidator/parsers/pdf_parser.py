@@ -1,28 +1,47 @@
 """PDF parser using pdfplumber library for structured tables."""
 
+import re
 from decimal import Decimal
+from importlib.util import find_spec
 from pathlib import Path
 
 from financial_consolidator.models.transaction import RawTransaction, TransactionType
 from financial_consolidator.parsers.base import BaseParser, ParseError
 from financial_consolidator.utils.date_utils import parse_date
-from financial_consolidator.utils.decimal_utils import parse_amount
+from financial_consolidator.utils.decimal_utils import parse_amount, parse_signed_amount
 from financial_consolidator.utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
-# Import pdfplumber - handle import error gracefully
-try:
-    import pdfplumber
-
-    PDFPLUMBER_AVAILABLE = True
-except ImportError:
-    PDFPLUMBER_AVAILABLE = False
-    pdfplumber = None  # type: ignore
+# pdfplumber pulls in pdfminer.six and Pillow, so it is imported where it is
+# used; runs without PDF statements never load it
+PDFPLUMBER_AVAILABLE = find_spec("pdfplumber") is not None
 
 # Maximum number of pages to process to prevent resource exhaustion
 MAX_PDF_PAGES = 500
 
+# A PDF header must start within the first 1024 bytes of the file
+PDF_SIGNATURE = b"%PDF-"
+PDF_SIGNATURE_WINDOW = 1024
+
+# A table as extracted by pdfplumber: rows of cell strings
+Table = list[list[str | None]]
+
+# Number of leading table rows searched for the header row
+HEADER_SEARCH_ROWS = 5
+
+# Any header keyword, for spotting the header row (matched anywhere in a cell)
+_HEADER_KEYWORD_RE = re.compile(
+    r"date|description|amount|debit|credit|balance|transaction|posted|memo|check|withdrawal|deposit"
+)
+
+# Header keywords for mapping column roles
+_DATE_HEADER_RE = re.compile(r"date|posted|trans")
+_DESCRIPTION_HEADER_RE = re.compile(r"description|desc|memo|payee|merchant|detail")
+_DEBIT_HEADER_RE = re.compile(r"debit|withdrawal|payment|charge")
+_CREDIT_HEADER_RE = re.compile(r"credit|deposit")
+_BALANCE_HEADER_RE = re.compile(r"balance|bal")
+
 
 class PDFParser(BaseParser):
     """Parser for PDF financial statements with structured tables.
@@ -31,6 +50,11 @@ class PDFParser(BaseParser):
     with well-structured tables - does not use OCR.
     """
 
+    def __init__(self) -> None:
+        """Initialize PDF parser."""
+        # Statements repeat the same header row on every page
+        self._mapping_cache: dict[tuple[str, ...], dict[str, int] | None] = {}
+
     @property
     def supported_extensions(self) -> list[str]:
         """Return supported file extensions."""
@@ -43,7 +67,8 @@ class PDFParser(BaseParser):
             file_path: Path to the file.
 
         Returns:
-            True if file is a parseable PDF with tables.
+            True if file is a PDF. Whether it holds tables is left to
+            parse(), which would otherwise repeat the extraction.
         """
         if not PDFPLUMBER_AVAILABLE:
             logger.warning("pdfplumber library not installed, PDF parsing unavailable")
@@ -52,17 +77,12 @@ class PDFParser(BaseParser):
         if not self._check_extension(file_path):
             return False
 
-        # Try to open and check for tables
         try:
-            with pdfplumber.open(file_path) as pdf:
-                # Check first few pages for tables
-                for page in pdf.pages[:3]:
-                    tables = page.extract_tables()
-                    if tables:
-                        return True
-            return False
-        except Exception:
+            with file_path.open("rb") as f:
+                head = f.read(PDF_SIGNATURE_WINDOW)
+        except OSError:
             return False
+        return PDF_SIGNATURE in head
 
     def parse(self, file_path: Path) -> list[RawTransaction]:
         """Parse a PDF file and return raw transactions.
@@ -74,7 +94,7 @@ class PDFParser(BaseParser):
             List of RawTransaction objects.
 
         Raises:
-            ParseError: If parsing fails.
+            ParseError: If parsing fails or the PDF has no tables.
         """
         if not PDFPLUMBER_AVAILABLE:
             raise ParseError("pdfplumber library not installed", file_path)
@@ -84,21 +104,26 @@ class PDFParser(BaseParser):
 
         logger.info(f"Parsing PDF file: {file_path.name}")
 
+        import pdfplumber
+
         transactions = []
         total_skipped = 0
+        table_count = 0
         try:
             with pdfplumber.open(file_path) as pdf:
+                page_count = len(pdf.pages)
+
                 # Check page count to prevent resource exhaustion
-                if len(pdf.pages) > MAX_PDF_PAGES:
+                if page_count > MAX_PDF_PAGES:
                     raise ParseError(
-                        f"PDF has too many pages ({len(pdf.pages)}). "
+                        f"PDF has too many pages ({page_count}). "
                         f"Maximum allowed is {MAX_PDF_PAGES}",
                         file_path,
                     )
 
                 for page_num, page in enumerate(pdf.pages, start=1):
                     tables = page.extract_tables()
-
+                    table_count += len(tables)
                     for table_num, table in enumerate(tables, start=1):
                         if not table:
                             continue
@@ -112,6 +137,9 @@ class PDFParser(BaseParser):
         except Exception as e:
             raise ParseError(f"Failed to parse PDF file: {e}", file_path) from e
 
+        if table_count == 0:
+            raise ParseError("No tables found in PDF file", file_path)
+
         logger.info(
             f"Parsed {len(transactions)} transactions from {file_path.name} "
             f"({total_skipped} rows skipped)"
@@ -131,6 +159,8 @@ class PDFParser(BaseParser):
             return None
 
         try:
+            import pdfplumber
+
             with pdfplumber.open(file_path) as pdf:
                 # Check first page text for institution names
                 if pdf.pages:
@@ -178,7 +208,7 @@ class PDFParser(BaseParser):
 
     def _parse_table(
         self,
-        table: list[list[str | None]],
+        table: Table,
         source_file: str,
         page_num: int,
         table_num: int,
@@ -207,12 +237,16 @@ class PDFParser(BaseParser):
             )
             return transactions, 0
 
-        headers = [
+        headers = tuple(
             (str(h).lower().strip() if h else "") for h in table[header_row_idx]
-        ]
+        )
 
-        # Detect column mapping
-        mapping = self._detect_column_mapping(headers)
+        # Detect column mapping, once per distinct header row
+        if headers in self._mapping_cache:
+            mapping = self._mapping_cache[headers]
+        else:
+            mapping = self._detect_column_mapping(list(headers))
+            self._mapping_cache[headers] = mapping
         if mapping is None:
             logger.debug(
                 f"Could not detect columns in table {table_num} on page {page_num}"
@@ -257,24 +291,18 @@ class PDFParser(BaseParser):
         Returns:
             Index of header row or None.
         """
-        header_keywords = [
-            "date", "description", "amount", "debit", "credit", "balance",
-            "transaction", "posted", "memo", "check", "withdrawal", "deposit",
-        ]
-
-        for i, row in enumerate(table[:5]):  # Check first 5 rows
+        for i, row in enumerate(table[:HEADER_SEARCH_ROWS]):
             if not row:
                 continue
 
-            # Count keyword matches
-            text_cells = [str(cell).lower() for cell in row if cell]
-            keyword_matches = sum(
-                1 for cell in text_cells
-                if any(kw in cell for kw in header_keywords)
-            )
-
-            if keyword_matches >= 2:
-                return i
+            # If at least 2 cells match a keyword, this is likely the header;
+            # stop counting as soon as the second one is seen
+            keyword_matches = 0
+            for cell in row:
+                if cell and _HEADER_KEYWORD_RE.search(str(cell).lower()):
+                    keyword_matches += 1
+                    if keyword_matches >= 2:
+                        return i
 
         return None
 
@@ -296,17 +324,12 @@ class PDFParser(BaseParser):
                 continue
 
             # Date column
-            if "date" not in mapping and any(
-                kw in header for kw in ["date", "posted", "trans"]
-            ):
+            if "date" not in mapping and _DATE_HEADER_RE.search(header):
                 if "description" not in header:
                     mapping["date"] = i
 
             # Description column
-            if "description" not in mapping and any(
-                kw in header
-                for kw in ["description", "desc", "memo", "payee", "merchant", "detail"]
-            ):
+            if "description" not in mapping and _DESCRIPTION_HEADER_RE.search(header):
                 mapping["description"] = i
 
             # Amount column
@@ -314,21 +337,15 @@ class PDFParser(BaseParser):
                 mapping["amount"] = i
 
             # Debit column
-            if "debit" not in mapping and any(
-                kw in header for kw in ["debit", "withdrawal", "payment", "charge"]
-            ):
+            if "debit" not in mapping and _DEBIT_HEADER_RE.search(header):
                 mapping["debit"] = i
 
             # Credit column
-            if "credit" not in mapping and any(
-                kw in header for kw in ["credit", "deposit"]
-            ):
+            if "credit" not in mapping and _CREDIT_HEADER_RE.search(header):
                 mapping["credit"] = i
 
             # Balance column
-            if "balance" not in mapping and any(
-                kw in header for kw in ["balance", "bal"]
-            ):
+            if "balance" not in mapping and _BALANCE_HEADER_RE.search(header):
                 mapping["balance"] = i
 
         # Validate minimum required columns
@@ -386,8 +403,7 @@ class PDFParser(BaseParser):
             amount_str = self._safe_get(row, mapping["amount"])
             if amount_str:
                 try:
-                    abs_amount, is_negative = parse_amount(amount_str)
-                    amount = -abs_amount if is_negative else abs_amount
+                    amount = parse_signed_amount(amount_str)
                     transaction_type = (
                         TransactionType.CREDIT if amount >= 0 else TransactionType.DEBIT
                     )
@@ -429,8 +445,7 @@ class PDFParser(BaseParser):
             balance_str = self._safe_get(row, mapping["balance"])
             if balance_str:
                 try:
-                    abs_balance, is_neg = parse_amount(balance_str)
-                    balance = -abs_balance if is_neg else abs_balance
+                    balance = parse_signed_amount(balance_str)
                 except ValueError:
                     pass
 
@@ -447,7 +462,7 @@ class PDFParser(BaseParser):
             raw_data={
                 "page_num": page_num,
                 "table_num": table_num,
-                "row": [str(v) if v else None for v in row],
+                "row": row,
                 "source": "pdf",
             },
         )
@@ -38,6 +38,41 @@ DATE_PATTERNS = [
 # Compiled regex patterns for efficiency
 COMPILED_PATTERNS = [(re.compile(pattern), fmt) for pattern, fmt in DATE_PATTERNS]
 
+# Regex group numbers of (year, month, day) for the all-numeric formats.
+# These are built directly with date() from the match instead of re-parsing
+# the string through strptime, which dominates per-row cost on large files.
+NUMERIC_GROUP_ORDER: dict[str, tuple[int, int, int]] = {
+    "%Y-%m-%d": (1, 2, 3),
+    "%m/%d/%Y": (3, 1, 2),
+    "%m/%d/%y": (3, 1, 2),
+    "%m-%d-%Y": (3, 1, 2),
+    "%m-%d-%y": (3, 1, 2),
+    "%d.%m.%Y": (3, 2, 1),
+    "%d.%m.%y": (3, 2, 1),
+}
+
+
+def _date_from_match(match: re.Match[str], order: tuple[int, int, int]) -> date:
+    """Build a date from the numeric groups of a DATE_PATTERNS match.
+
+    Two-digit years follow strptime's %y pivot (00-68 -> 2000s, 69-99 -> 1900s).
+
+    Args:
+        match: Match of one of the all-numeric patterns.
+        order: Group numbers of (year, month, day).
+
+    Returns:
+        Parsed date object.
+
+    Raises:
+        ValueError: If the fields do not form a valid date.
+    """
+    year_str, month_str, day_str = match.group(*order)
+    year = int(year_str)
+    if len(year_str) == 2:
+        year += 2000 if year <= 68 else 1900
+    return date(year, int(month_str), int(day_str))
+
 
 def parse_date(raw_date: str) -> date:
     """Parse a raw date string into a date object.
@@ -67,8 +102,12 @@ def parse_date(raw_date: str) -> date:
 
     # Try each pattern
     for pattern, fmt in COMPILED_PATTERNS:
-        if pattern.match(date_str):
+        match = pattern.match(date_str)
+        if match:
             try:
+                order = NUMERIC_GROUP_ORDER.get(fmt)
+                if order is not None:
+                    return _date_from_match(match, order)
                 parsed = datetime.strptime(date_str, fmt)
                 return parsed.date()
             except ValueError:
@@ -89,6 +128,44 @@ def parse_date(raw_date: str) -> date:
     raise ValueError(f"Cannot parse date: '{raw_date}'")
 
 
+# Zero-padded formats that parse_fixed_date reads by position, as
+# (separator, separator positions, year slice, month slice, day slice)
+FIXED_DATE_LAYOUTS: dict[str, tuple[str, tuple[int, int], slice, slice, slice]] = {
+    "%m/%d/%Y": ("/", (2, 5), slice(6, 10), slice(0, 2), slice(3, 5)),
+    "%Y-%m-%d": ("-", (4, 7), slice(0, 4), slice(5, 7), slice(8, 10)),
+}
+
+
+def parse_fixed_date(date_str: str, fmt: str) -> date | None:
+    """Parse a zero-padded date whose layout is already known.
+
+    Reads the digits by position instead of matching every pattern in
+    DATE_PATTERNS. Intended for files whose date format was detected once
+    up front; callers fall back to parse_date when this returns None.
+
+    Args:
+        date_str: Stripped date string, e.g. "01/15/2024".
+        fmt: One of the FIXED_DATE_LAYOUTS keys.
+
+    Returns:
+        Parsed date, or None if the string does not fit the layout or is
+        not a valid date.
+    """
+    layout = FIXED_DATE_LAYOUTS.get(fmt)
+    if layout is None or len(date_str) != 10:
+        return None
+    separator, (sep1, sep2), year_slice, month_slice, day_slice = layout
+    if date_str[sep1] != separator or date_str[sep2] != separator:
+        return None
+    year, month, day = date_str[year_slice], date_str[month_slice], date_str[day_slice]
+    if not (year + month + day).isdecimal() or not date_str.isascii():
+        return None
+    try:
+        return date(int(year), int(month), int(day))
+    except ValueError:
+        return None
+
+
 def format_date(d: date, fmt: str = "%Y-%m-%d") -> str:
     """Format a date object as a string.
 
@@ -15,6 +15,9 @@ PARENS_NEGATIVE_PATTERN = re.compile(r"^\s*\(\s*([^)]+)\s*\)\s*$")
 # Regex for trailing DR/CR indicators
 DR_CR_PATTERN = re.compile(r"\s*(DR|CR|D|C)\s*$", re.IGNORECASE)
 
+# Plain signed decimal with no symbols or separators: -1234.56, 1234, 0.5
+PLAIN_AMOUNT_PATTERN = re.compile(r"(-?)([0-9]+(?:\.[0-9]+)?)")
+
 
 def parse_amount(raw_amount: str, locale: str = "US") -> tuple[Decimal, bool]:
     """Parse a raw amount string into a Decimal.
@@ -46,6 +49,13 @@ def parse_amount(raw_amount: str, locale: str = "US") -> tuple[Decimal, bool]:
 
     original = raw_amount
     amount_str = raw_amount.strip()
+
+    # Fast path for the common case of a bare number
+    plain_match = PLAIN_AMOUNT_PATTERN.fullmatch(amount_str)
+    if plain_match:
+        sign, digits = plain_match.groups()
+        return abs(Decimal(digits)), sign == "-"
+
     is_negative = False
 
     # Check for parentheses notation: ($1,234.56) or (1234.56)
@@ -108,6 +118,25 @@ def parse_amount(raw_amount: str, locale: str = "US") -> tuple[Decimal, bool]:
     return abs(amount), is_negative
 
 
+def parse_signed_amount(raw_amount: str, locale: str = "US") -> Decimal:
+    """Parse a raw amount string into a signed Decimal.
+
+    Same formats as parse_amount, with the sign applied to the result.
+
+    Args:
+        raw_amount: The raw amount string to parse.
+        locale: Locale hint for ambiguous formats ("US" or "EU"). Default: "US".
+
+    Returns:
+        Amount as Decimal, negative for debits.
+
+    Raises:
+        ValueError: If the amount cannot be parsed.
+    """
+    abs_amount, is_negative = parse_amount(raw_amount, locale)
+    return -abs_amount if is_negative else abs_amount
+
+
 def format_currency(
     amount: Decimal,
     decimal_places: int = 2,
@@ -3,8 +3,10 @@
 
 # Characters that trigger formula execution in spreadsheet applications
 # when they appear at the start of a cell value
-# Includes | for DDE (Dynamic Data Exchange) attack prevention
-_FORMULA_CHARS = ("=", "+", "-", "@", "\t", "\r", "\n", "|")
+# Includes | for DDE (Dynamic Data Exchange) attack prevention.
+# All triggers are single characters, so a set lookup on the first
+# character replaces str.startswith() over a tuple.
+_FORMULA_CHARS = frozenset("=+-@\t\r\n|")
 
 
 def sanitize_for_csv(value: str | None) -> str | None:
@@ -28,7 +30,7 @@ def sanitize_for_csv(value: str | None) -> str | None:
         return value
 
     # Check if value starts with a formula-triggering character
-    if value.startswith(_FORMULA_CHARS):
+    if value[0] in _FORMULA_CHARS:
         # Prefix with single quote to prevent formula execution
         return "'" + value
 
@@ -0,0 +1,156 @@
+"""Tests for CSVParser row reading."""
+
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from financial_consolidator.parsers.base import ParseError
+from financial_consolidator.parsers.csv_parser import CSVFormat, CSVParser
+
+
+def write_csv(tmp_path: Path, content: str) -> Path:
+    """Helper to write a CSV statement to disk."""
+    path = tmp_path / "statement.csv"
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+class TestParse:
+    """Tests for CSVParser.parse."""
+
+    def test_quoted_fields_and_blank_rows(self, tmp_path: Path) -> None:
+        """Test quoted delimiters and newlines survive and blank rows are skipped."""
+        path = write_csv(
+            tmp_path,
+            "Account Number: 1234\n"
+            "\n"
+            "Date,Description,Amount\n"
+            '01/02/2025,"Coffee, Downtown",-3.50\n'
+            '01/03/2025,"Rent\nJanuary",-1200.00\n'
+            "\n"
+            " , ,  \n"
+            "01/05/2025,Paycheck,2500.00\n",
+        )
+
+        transactions = CSVParser(strict=True).parse(path)
+
+        assert [(t.description, t.amount) for t in transactions] == [
+            ("Coffee, Downtown", Decimal("-3.50")),
+            ("Rent\nJanuary", Decimal("-1200.00")),
+            ("Paycheck", Decimal("2500.00")),
+        ]
+        assert transactions[0].raw_data["row"] == ["01/02/2025", "Coffee, Downtown", "-3.50"]
+
+    def test_unpadded_dates_fall_back(self, tmp_path: Path) -> None:
+        """Test rows not matching the detected date layout still parse."""
+        path = write_csv(
+            tmp_path,
+            "Date,Description,Amount\n01/02/2025,Coffee,-3.50\n1/3/2025,Tea,-2.00\n",
+        )
+
+        transactions = CSVParser(strict=True).parse(path)
+
+        assert [t.date for t in transactions] == [date(2025, 1, 2), date(2025, 1, 3)]
+
+    def test_parse_iter_streams_rows(self, tmp_path: Path) -> None:
+        """Test parse_iter yields the same transactions as parse, one at a time."""
+        path = write_csv(
+            tmp_path,
+            "Date,Description,Amount\n01/02/2025,Coffee,-3.50\n01/03/2025,Tea,-2.00\n",
+        )
+        parser = CSVParser()
+
+        rows = parser.parse_iter(path)
+
+        assert next(rows).description == "Coffee"
+        assert [t.description for t in rows] == ["Tea"]
+        assert [t.description for t in parser.parse(path)] == ["Coffee", "Tea"]
+
+    def test_parse_iter_checks_file_eagerly(self, tmp_path: Path) -> None:
+        """Test parse_iter reports an undetectable file before iteration starts."""
+        path = write_csv(tmp_path, "just some text\n")
+
+        with pytest.raises(ParseError):
+            CSVParser().parse_iter(path)
+
+    def test_short_rows_skipped(self, tmp_path: Path) -> None:
+        """Test rows missing the description column are skipped, not errors."""
+        path = write_csv(
+            tmp_path,
+            "Date,Amount,Description\n01/02/2025,-3.50\n01/03/2025,-2.00,Tea\n",
+        )
+
+        transactions = CSVParser().parse(path)
+
+        assert [t.description for t in transactions] == ["Tea"]
+
+
+class TestFormatDetection:
+    """Tests for header and metadata line detection."""
+
+    @pytest.mark.parametrize(
+        "line",
+        ["Account Number: 1234", "Statement Period 01/01-01/31", "As of 2025-01-31", "Downloaded", "  "],
+    )
+    def test_metadata_lines(self, line: str) -> None:
+        """Test account and statement preamble lines are recognised as metadata."""
+        assert CSVParser()._is_metadata_line(line)
+
+    @pytest.mark.parametrize("line", ["Accountant fees,10.00", "Date,Description,Amount"])
+    def test_non_metadata_lines(self, line: str) -> None:
+        """Test data and header lines are not treated as metadata."""
+        assert not CSVParser()._is_metadata_line(line)
+
+    def test_numeric_row_is_not_header(self) -> None:
+        """Test a row of dates and amounts is not mistaken for a header."""
+        parser = CSVParser()
+
+        assert parser._looks_like_header("Date,Description,Amount", ",")
+        assert not parser._looks_like_header("01/02/2025,$3.50,(4.00)", ",")
+
+    def test_date_format_detected(self, tmp_path: Path) -> None:
+        """Test a zero-padded date layout is detected from the first data row."""
+        iso = write_csv(tmp_path, "Date,Description,Amount\n\n2025-01-02,Coffee,-3.50\n")
+        fmt = CSVParser()._detect_format(iso)
+        assert fmt is not None and fmt.date_format == "%Y-%m-%d"
+
+        text_month = write_csv(tmp_path, "Date,Description,Amount\n02-Jan-2025,Coffee,-3.50\n")
+        fmt = CSVParser()._detect_format(text_month)
+        assert fmt is not None and fmt.date_format is None
+
+    def test_format_cached_until_file_changes(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test can_parse and parse share one detection until the file is modified."""
+        path = write_csv(tmp_path, "Date,Description,Amount\n01/02/2025,Coffee,-3.50\n")
+        parser = CSVParser()
+        calls: list[Path] = []
+        detect = parser._detect_format_uncached
+
+        def counting_detect(file_path: Path) -> CSVFormat | None:
+            calls.append(file_path)
+            return detect(file_path)
+
+        monkeypatch.setattr(parser, "_detect_format_uncached", counting_detect)
+
+        assert parser.can_parse(path)
+        assert len(parser.parse(path)) == 1
+        parser.detect_institution(path)
+        assert len(calls) == 1
+
+        path.write_text("Date,Description,Amount\n01/02/2025,Coffee,-3.50\n01/03/2025,Tea,-2.00\n")
+        assert len(parser.parse(path)) == 2
+        assert len(calls) == 2
+
+    def test_auto_detect_columns(self) -> None:
+        """Test unknown headers are mapped to roles by keyword."""
+        headers = ["Posted On", "Payee Name", "Withdrawals", "Deposits", "Running Total"]
+        col_indices = {h.lower(): i for i, h in enumerate(headers)}
+
+        mapping = CSVParser()._auto_detect_columns(headers, col_indices)
+
+        assert mapping is not None
+        assert (mapping.date_col, mapping.description_col) == (0, 1)
+        assert (mapping.debit_col, mapping.credit_col, mapping.balance_col) == (2, 3, 4)
@@ -0,0 +1,61 @@
+"""Tests for date parsing utilities."""
+
+from datetime import date
+
+import pytest
+
+from financial_consolidator.utils.date_utils import parse_date, parse_fixed_date
+
+
+class TestParseDate:
+    """Tests for parse_date."""
+
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [
+            ("2024-01-15", date(2024, 1, 15)),
+            ("1/5/2024", date(2024, 1, 5)),
+            ("01/15/24", date(2024, 1, 15)),
+            ("01-15-2024", date(2024, 1, 15)),
+            ("12-31-99", date(1999, 12, 31)),
+            ("15.01.2024", date(2024, 1, 15)),
+            ("15.01.68", date(2068, 1, 15)),
+            ("15.01.69", date(1969, 1, 15)),
+            ("15-Jan-2024", date(2024, 1, 15)),
+            ("Jan 15, 2024", date(2024, 1, 15)),
+            ("20240115", date(2024, 1, 15)),
+        ],
+    )
+    def test_supported_formats(self, raw: str, expected: date) -> None:
+        """Test each supported format, including the two-digit year pivot."""
+        assert parse_date(raw) == expected
+
+    @pytest.mark.parametrize("raw", ["02/30/2024", "13/01/2024", "2024-00-10", "not a date"])
+    def test_invalid_dates_raise(self, raw: str) -> None:
+        """Test impossible or unrecognised dates raise ValueError."""
+        with pytest.raises(ValueError):
+            parse_date(raw)
+
+
+class TestParseFixedDate:
+    """Tests for parse_fixed_date."""
+
+    def test_known_layouts(self) -> None:
+        """Test zero-padded US and ISO dates are read by position."""
+        assert parse_fixed_date("01/15/2024", "%m/%d/%Y") == date(2024, 1, 15)
+        assert parse_fixed_date("2024-01-15", "%Y-%m-%d") == date(2024, 1, 15)
+
+    @pytest.mark.parametrize(
+        ("raw", "fmt"),
+        [
+            ("1/15/2024", "%m/%d/%Y"),
+            ("01-15-2024", "%m/%d/%Y"),
+            ("02/30/2024", "%m/%d/%Y"),
+            ("+1/15/2024", "%m/%d/%Y"),
+            ("2024/01/15", "%Y-%m-%d"),
+            ("15.01.2024", "%d.%m.%Y"),
+        ],
+    )
+    def test_mismatch_returns_none(self, raw: str, fmt: str) -> None:
+        """Test strings that do not fit the layout defer to parse_date."""
+        assert parse_fixed_date(raw, fmt) is None
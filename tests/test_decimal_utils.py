@@ -0,0 +1,48 @@
+"""Tests for decimal amount parsing utilities."""
+
+from decimal import Decimal
+
+import pytest
+
+from financial_consolidator.utils.decimal_utils import parse_amount, parse_signed_amount
+
+
+class TestParseAmount:
+    """Tests for parse_amount."""
+
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [
+            ("1234.56", (Decimal("1234.56"), False)),
+            ("-1234.56", (Decimal("1234.56"), True)),
+            ("-0.00", (Decimal("0.00"), True)),
+            (" 42 ", (Decimal("42"), False)),
+            ("$1,234.56", (Decimal("1234.56"), False)),
+            ("-$1,234.56", (Decimal("1234.56"), True)),
+            ("($1,234.56)", (Decimal("1234.56"), True)),
+            ("1.234,56", (Decimal("1234.56"), False)),
+            ("12.00 DR", (Decimal("12.00"), True)),
+            ("12.00 CR", (Decimal("12.00"), False)),
+        ],
+    )
+    def test_formats(self, raw: str, expected: tuple[Decimal, bool]) -> None:
+        """Test plain numbers and symbol/separator/sign notations parse alike."""
+        assert parse_amount(raw) == expected
+
+    @pytest.mark.parametrize("raw", ["", "abc", "1.2.3"])
+    def test_invalid_amounts_raise(self, raw: str) -> None:
+        """Test unparseable amounts raise ValueError."""
+        with pytest.raises(ValueError):
+            parse_amount(raw)
+
+
+class TestParseSignedAmount:
+    """Tests for parse_signed_amount."""
+
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [("12.50", Decimal("12.50")), ("-12.50", Decimal("-12.50")), ("($3.00)", Decimal("-3.00"))],
+    )
+    def test_sign_applied(self, raw: str, expected: Decimal) -> None:
+        """Test the parse_amount sign flag is applied to the result."""
+        assert parse_signed_amount(raw) == expected
@@ -0,0 +1,249 @@
+"""Tests for FileDetector file discovery."""
+
+import multiprocessing
+import os
+import pickle
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+import pytest
+
+from financial_consolidator.parsers.base import BaseParser, ParseError
+from financial_consolidator.parsers.csv_parser import CSVParser
+from financial_consolidator.parsers.detector import FileDetector, get_detector
+
+
+class TwoArgError(Exception):
+    """Exception that cannot be rebuilt from its pickle (args holds one value)."""
+
+    def __init__(self, message: str, code: int):
+        super().__init__(message)
+        self.code = code
+
+
+class TestDiscoverFiles:
+    """Tests for FileDetector.discover_files."""
+
+    def test_recursive_discovery_filters_extensions(self, tmp_path: Path) -> None:
+        """Test supported files are found in subdirectories, sorted by name."""
+        (tmp_path / "nested" / "deeper").mkdir(parents=True)
+        (tmp_path / "b.csv").touch()
+        (tmp_path / "nested" / "A.QFX").touch()
+        (tmp_path / "nested" / "deeper" / "c.pdf").touch()
+        (tmp_path / "nested" / "notes.doc").touch()
+        (tmp_path / "folder.csv").mkdir()
+
+        files = FileDetector().discover_files(tmp_path)
+
+        assert [p.relative_to(tmp_path).as_posix() for p in files] == [
+            "nested/A.QFX",
+            "b.csv",
+            "nested/deeper/c.pdf",
+        ]
+
+    def test_symlinks_resolved_within_directory(self, tmp_path: Path) -> None:
+        """Test symlinks are kept only when they resolve inside the directory."""
+        root = tmp_path / "statements"
+        root.mkdir()
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        (outside / "secret.csv").touch()
+        (root / "real.csv").touch()
+        (root / "inside.csv").symlink_to(root / "real.csv")
+        (root / "escape.csv").symlink_to(outside / "secret.csv")
+        (root / "broken.csv").symlink_to(root / "missing.csv")
+        (root / "linked_dir").symlink_to(outside)
+
+        files = FileDetector().discover_files(root)
+
+        assert sorted(p.name for p in files) == ["inside.csv", "real.csv"]
+
+
+class TestDetectParser:
+    """Tests for FileDetector.detect_parser."""
+
+    def test_only_parsers_for_extension_probed(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a file is only offered to parsers claiming its extension."""
+        path = tmp_path / "a.csv"
+        path.write_text("Date,Description,Amount\n01/02/2025,Coffee,-3.50\n")
+        detector = FileDetector()
+        probed: list[str] = []
+
+        def recording(parser: BaseParser) -> Callable[[Path], bool]:
+            can_parse = parser.can_parse
+
+            def recording_can_parse(file_path: Path) -> bool:
+                probed.append(parser.name)
+                return can_parse(file_path)
+
+            return recording_can_parse
+
+        for parser in detector.parsers:
+            monkeypatch.setattr(parser, "can_parse", recording(parser))
+
+        assert detector.detect_parser(path) is detector.parsers[0]
+        assert detector.detect_parser(tmp_path / "notes.doc") is None
+        assert probed == ["CSVParser", "CSVParser", "OFXParser", "ExcelParser", "PDFParser"]
+
+    def test_detect_institution_stops_at_first_match(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a failing lookup on the matched parser does not fall through."""
+        path = tmp_path / "statement.dat"
+        path.write_text("Date,Description,Amount\n01/02/2025,Coffee,-3.50\n")
+        detector = FileDetector()
+        first, second = detector.parsers[:2]
+
+        def failing_lookup(file_path: Path) -> str | None:
+            raise ValueError("unreadable")
+
+        monkeypatch.setattr(first, "can_parse", lambda file_path: True)
+        monkeypatch.setattr(first, "detect_institution", failing_lookup)
+        monkeypatch.setattr(second, "can_parse", lambda file_path: True)
+        monkeypatch.setattr(second, "detect_institution", lambda file_path: "Other Bank")
+
+        assert detector.detect_institution(path) is None
+
+
+class TestParseDirectory:
+    """Tests for FileDetector.parse_directory."""
+
+    def write_statements(self, directory: Path) -> None:
+        """Helper to write two good statements and one unparseable file."""
+        (directory / "a.csv").write_text("Date,Description,Amount\n01/02/2025,Coffee,-3.50\n")
+        (directory / "b.csv").write_text(
+            "Date,Description,Amount\n01/03/2025,Tea,-2.00\n01/04/2025,Pay,100.00\n"
+        )
+        (directory / "c.csv").write_text("just some text\n")
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_results_and_errors(self, tmp_path: Path, max_workers: int) -> None:
+        """Test serial and worker-process parsing give the same results."""
+        self.write_statements(tmp_path)
+
+        transactions, parsed, errors = FileDetector().parse_directory(
+            tmp_path, max_workers=max_workers
+        )
+
+        assert [t.description for t in transactions] == ["Coffee", "Tea", "Pay"]
+        assert parsed == ["a.csv", "b.csv"]
+        assert len(errors) == 1 and errors[0].startswith("c.csv: ")
+
+    def test_strict_raises_in_worker_mode(self, tmp_path: Path) -> None:
+        """Test strict mode still raises ParseError when using workers."""
+        self.write_statements(tmp_path)
+
+        with pytest.raises(ParseError, match="c.csv"):
+            FileDetector().parse_directory(tmp_path, strict=True, max_workers=2)
+
+    def test_unpicklable_worker_error_reported_per_file(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a worker exception that cannot be unpickled only fails its own file."""
+        if multiprocessing.get_start_method() != "fork":
+            pytest.skip("workers only see the patched parser when forked")
+        self.write_statements(tmp_path)
+        csv_parse = CSVParser.parse
+
+        def failing_parse(parser: CSVParser, file_path: Path) -> object:
+            if file_path.name == "a.csv":
+                raise TwoArgError("boom", 7)
+            return csv_parse(parser, file_path)
+
+        monkeypatch.setattr(CSVParser, "parse", failing_parse)
+
+        transactions, parsed, errors = FileDetector().parse_directory(
+            tmp_path, max_workers=2
+        )
+
+        assert [t.description for t in transactions] == ["Tea", "Pay"]
+        assert parsed == ["b.csv"]
+        assert errors[0] == "a.csv: Unexpected error: TwoArgError: boom"
+        assert errors[1].startswith("c.csv: ")
+
+    def test_dead_worker_reported_per_file(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a worker process exiting mid-parse becomes a file error, not a crash."""
+        if multiprocessing.get_start_method() != "fork":
+            pytest.skip("workers only see the patched parser when forked")
+        self.write_statements(tmp_path)
+        csv_parse = CSVParser.parse
+
+        def exiting_parse(parser: CSVParser, file_path: Path) -> object:
+            if file_path.name == "a.csv":
+                os._exit(1)
+            return csv_parse(parser, file_path)
+
+        monkeypatch.setattr(CSVParser, "parse", exiting_parse)
+
+        _, parsed, errors = FileDetector().parse_directory(tmp_path, max_workers=2)
+
+        assert "a.csv" not in parsed
+        assert errors[0].startswith("a.csv: Unexpected error: ")
+
+    def test_submit_failure_reported_per_file(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test files the pool refuses to queue come back as errors, not a raise."""
+        self.write_statements(tmp_path)
+        files = [tmp_path / "a.csv", tmp_path / "b.csv", tmp_path / "c.csv"]
+        submit = ProcessPoolExecutor.submit
+        submitted: list[object] = []
+
+        def breaking_submit(executor: ProcessPoolExecutor, *args: object) -> object:
+            if submitted:
+                raise BrokenProcessPool("pool died")
+            submitted.append(args)
+            return submit(executor, *args)
+
+        monkeypatch.setattr(ProcessPoolExecutor, "submit", breaking_submit)
+
+        results = list(FileDetector().iter_parse_files(files, max_workers=2))
+
+        assert [len(txns or []) for _, txns, _ in results] == [1, 0, 0]
+        assert [type(error) for _, _, error in results] == [
+            type(None), BrokenProcessPool, BrokenProcessPool
+        ]
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_iter_parse_files_keeps_file_order(
+        self, tmp_path: Path, max_workers: int
+    ) -> None:
+        """Test outcomes are yielded per file, in the order given."""
+        self.write_statements(tmp_path)
+        files = [tmp_path / "c.csv", tmp_path / "b.csv", tmp_path / "a.csv"]
+
+        results = list(FileDetector().iter_parse_files(files, max_workers=max_workers))
+
+        assert [path for path, _, _ in results] == files
+        assert isinstance(results[0][2], ParseError) and results[0][1] is None
+        assert [len(txns or []) for _, txns, _ in results] == [0, 2, 1]
+
+
+class TestParseError:
+    """Tests for ParseError."""
+
+    def test_pickle_keeps_file_path(self) -> None:
+        """Test file_path survives the trip back from a worker process."""
+        error = pickle.loads(pickle.dumps(ParseError("bad row", Path("s.csv"))))
+
+        assert str(error) == "bad row"
+        assert error.file_path == Path("s.csv")
+
+
+class TestGetDetector:
+    """Tests for the shared get_detector instances."""
+
+    def test_one_instance_per_strict_setting(self) -> None:
+        """Test alternating strict values reuses the same two detectors."""
+        lenient = get_detector()
+        strict = get_detector(strict=True)
+
+        assert strict.strict and not lenient.strict
+        assert get_detector() is lenient
+        assert get_detector(strict=True) is strict
@@ -0,0 +1,176 @@
+"""Tests for ExcelParser worksheet parsing."""
+
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+from openpyxl import Workbook
+
+from financial_consolidator.parsers import excel_parser
+from financial_consolidator.parsers.base import ParseError
+from financial_consolidator.parsers.excel_parser import ExcelParser
+
+
+def write_statement(path: Path, rows: list[list[object]]) -> Path:
+    """Helper to write a single-sheet statement workbook."""
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Statement"
+    for row in rows:
+        ws.append(row)
+    wb.save(path)
+    return path
+
+
+class TestParseWorksheet:
+    """Tests for ExcelParser._parse_worksheet via parse."""
+
+    def test_header_after_preamble(self, tmp_path: Path) -> None:
+        """Test the header is found below preamble rows and all data rows stream."""
+        rows: list[list[object]] = [["Account Number: 1234"], [], ["Date", "Description", "Amount"]]
+        rows += [[date(2025, 1, day), f"Purchase {day}", -day] for day in range(1, 31)]
+        path = write_statement(tmp_path / "statement.xlsx", rows)
+
+        transactions = ExcelParser().parse(path)
+
+        assert len(transactions) == 30
+        assert transactions[0].date == date(2025, 1, 1)
+        assert transactions[-1].description == "Purchase 30"
+        assert transactions[-1].amount == Decimal("-30")
+        assert transactions[-1].raw_data is not None
+        assert transactions[-1].raw_data["row"][1:] == ("Purchase 30", -30)
+
+    def test_no_header_in_search_window(self, tmp_path: Path) -> None:
+        """Test a sheet whose header lies past the search window yields nothing."""
+        rows: list[list[object]] = [[f"note {i}"] for i in range(25)]
+        rows += [["Date", "Description", "Amount"], [date(2025, 1, 2), "Coffee", -3.5]]
+        path = write_statement(tmp_path / "statement.xlsx", rows)
+
+        assert ExcelParser().parse(path) == []
+
+    def test_debit_credit_columns_mapped(self, tmp_path: Path) -> None:
+        """Test keyword-mapped debit/credit/balance columns are parsed."""
+        rows: list[list[object]] = [
+            ["Posted", "Payee Name", "Withdrawals", "Deposits", "Balance"],
+            [date(2025, 1, 2), "Coffee", 3.5, None, 96.5],
+            [date(2025, 1, 3), "Paycheck", None, 100, 196.5],
+        ]
+        path = write_statement(tmp_path / "statement.xlsx", rows)
+
+        transactions = ExcelParser().parse(path)
+
+        assert [(t.description, t.amount) for t in transactions] == [
+            ("Coffee", Decimal("-3.5")),
+            ("Paycheck", Decimal("100")),
+        ]
+        assert transactions[1].balance == Decimal("196.5")
+
+    def test_blank_rows_skipped(self, tmp_path: Path) -> None:
+        """Test rows of empty or whitespace-only cells are skipped."""
+        rows: list[list[object]] = [
+            ["Date", "Description", "Amount"],
+            [date(2025, 1, 2), "Coffee", -3.5],
+            [None, "   ", None],
+            [],
+            [date(2025, 1, 3), "Tea", 0],
+        ]
+        path = write_statement(tmp_path / "statement.xlsx", rows)
+
+        transactions = ExcelParser().parse(path)
+
+        assert [t.description for t in transactions] == ["Coffee", "Tea"]
+
+    def test_row_errors_reported_once(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Test failing rows are skipped and summarised in a single warning."""
+        rows: list[list[object]] = [["Date", "Description", "Amount"]]
+        rows += [[date(2025, 1, day), f"Purchase {day}", -day] for day in range(1, 11)]
+        path = write_statement(tmp_path / "statement.xlsx", rows)
+        parser = ExcelParser()
+        parse_row = parser._parse_row
+
+        def failing_parse_row(row: tuple[object, ...], *args: object) -> object:
+            if row[2] != -1:
+                raise ValueError("bad row")
+            return parse_row(row, *args)  # type: ignore[arg-type]
+
+        monkeypatch.setattr(parser, "_parse_row", failing_parse_row)
+
+        with caplog.at_level("WARNING"):
+            transactions = parser.parse(path)
+
+        assert [t.description for t in transactions] == ["Purchase 1"]
+        warnings = [r.getMessage() for r in caplog.records if r.levelname == "WARNING"]
+        assert len(warnings) == 1
+        assert "Skipped 9 rows" in warnings[0] and "(and 4 more)" in warnings[0]
+
+
+class TestParseRow:
+    """Tests for ExcelParser._parse_row."""
+
+    def test_short_rows_read_missing_cells_as_none(self) -> None:
+        """Test cells past a short row's end are treated as empty."""
+        parser = ExcelParser()
+        mapping = {"date": 0, "description": 1, "amount": 2, "memo": 3}
+
+        txn = parser._parse_row((date(2025, 1, 2), "Coffee", -3.5), mapping, "s.xlsx", "Sheet")
+
+        assert txn is not None and txn.memo is None
+        assert parser._parse_row((date(2025, 1, 2), "Coffee"), mapping, "s.xlsx", "Sheet") is None
+
+
+class TestCanParse:
+    """Tests for ExcelParser.can_parse."""
+
+    def test_signature_checked_without_loading(self, tmp_path: Path) -> None:
+        """Test the file signature decides can_parse and parse reports bad files."""
+        good = write_statement(tmp_path / "good.xlsx", [["Date", "Description", "Amount"]])
+        bad = tmp_path / "bad.xlsx"
+        bad.write_text("Date,Description,Amount\n", encoding="utf-8")
+        parser = ExcelParser()
+
+        assert parser.can_parse(good)
+        assert not parser.can_parse(bad)
+        assert not parser.can_parse(tmp_path / "missing.xlsx")
+
+        truncated = tmp_path / "truncated.xlsx"
+        truncated.write_bytes(good.read_bytes()[:100])
+        assert parser.can_parse(truncated)
+        with pytest.raises(ParseError):
+            parser.parse(truncated)
+
+
+class TestBackends:
+    """Tests for the python-calamine and openpyxl reading paths."""
+
+    def test_backends_agree(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test calamine reads cells as the openpyxl fallback does."""
+        pytest.importorskip("python_calamine")
+        wb = Workbook()
+        ws = wb.active
+        ws["B2"] = "Date"
+        ws["C2"] = "Description"
+        ws["D2"] = "Amount"
+        ws["E2"] = "Check"
+        ws.append([None, date(2025, 1, 2), "Coffee", -3.5, None])
+        ws.append([None, "01/03/2025", "Rent", -1200, 1042])
+        path = tmp_path / "statement.xlsx"
+        wb.save(path)
+
+        fast = ExcelParser().parse(path)
+        monkeypatch.setattr(excel_parser, "CALAMINE_AVAILABLE", False)
+        slow = ExcelParser().parse(path)
+
+        # raw_data keeps each backend's own cell objects (date vs datetime)
+        for txn in fast + slow:
+            txn.raw_data = None
+        assert fast == slow
+        assert [(t.amount, t.check_number) for t in fast] == [
+            (Decimal("-3.5"), None),
+            (Decimal("-1200"), "1042"),
+        ]
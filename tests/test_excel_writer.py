@@ -0,0 +1,242 @@
+"""Tests for ExcelWriter workbook generation."""
+
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+
+from openpyxl import load_workbook
+
+from financial_consolidator.config import Config
+from financial_consolidator.models.account import Account, AccountType
+from financial_consolidator.models.category import Category, CategoryType
+from financial_consolidator.models.transaction import Transaction, TransactionType
+from financial_consolidator.output.excel_writer import ExcelWriter
+from financial_consolidator.processing.report_generator import generate_pl_summary
+
+
+def create_transaction(
+    amount: Decimal,
+    category: str | None = None,
+    trans_date: date = date(2025, 1, 15),
+    description: str = "Test Transaction",
+    account_id: str = "checking",
+    account_name: str = "Checking",
+) -> Transaction:
+    """Helper to create a Transaction for testing."""
+    txn = Transaction(
+        date=trans_date,
+        description=description,
+        amount=amount,
+        transaction_type=TransactionType.DEBIT if amount < 0 else TransactionType.CREDIT,
+        account_id=account_id,
+        account_name=account_name,
+        source_file="test.csv",
+    )
+    if category:
+        txn.assign_category(category, "rule", confidence=0.9)
+    return txn
+
+
+def create_config() -> Config:
+    """Create a Config with one account and a few categories."""
+    return Config(
+        accounts={
+            "checking": Account(
+                id="checking",
+                name="Checking",
+                account_type=AccountType.CHECKING,
+                opening_balance=Decimal("100.00"),
+                opening_balance_date=date(2024, 12, 31),
+            ),
+        },
+        categories={
+            "dining": Category(id="dining", name="Dining", category_type=CategoryType.EXPENSE),
+            "salary": Category(id="salary", name="Salary", category_type=CategoryType.INCOME),
+            "transfers": Category(id="transfers", name="Transfers", category_type=CategoryType.TRANSFER),
+        },
+    )
+
+
+def write_workbook(
+    tmp_path: Path,
+    transactions: list[Transaction],
+    date_gaps: list[dict[str, object]] | None = None,
+    config: Config | None = None,
+) -> Path:
+    """Write a workbook for the given transactions and return its path."""
+    config = config or create_config()
+    output_path = tmp_path / "report.xlsx"
+    ExcelWriter(config).write(
+        output_path, transactions, date_gaps, generate_pl_summary(transactions, config)
+    )
+    return output_path
+
+
+class TestAnomaliesSheet:
+    """Tests for the Anomalies sheet."""
+
+    def test_no_anomalies_writes_placeholder(self, tmp_path: Path) -> None:
+        """Test that clean data produces a single placeholder cell."""
+        path = write_workbook(tmp_path, [create_transaction(Decimal("-10.00"), "dining")])
+
+        ws = load_workbook(path)["Anomalies"]
+        assert ws["A1"].value == "No anomalies detected"
+        assert ws.max_row == 1
+
+    def test_anomalies_listed(self, tmp_path: Path) -> None:
+        """Test that flagged transactions and date gaps are both written."""
+        txn = create_transaction(Decimal("-9000.00"), "dining", description="Big purchase")
+        txn.add_anomaly("Large transaction")
+        gaps: list[dict[str, object]] = [
+            {
+                "account_id": "checking",
+                "start_date": date(2025, 2, 1),
+                "end_date": date(2025, 3, 15),
+                "gap_days": 42,
+                "severity": "alert",
+            }
+        ]
+        path = write_workbook(tmp_path, [txn], gaps)
+
+        ws = load_workbook(path)["Anomalies"]
+        values = [cell.value for row in ws.iter_rows() for cell in row if cell.value is not None]
+        assert "Transaction Anomalies" in values
+        assert "Big purchase" in values
+        assert "Large transaction" in values
+        assert "Date Gap Anomalies" in values
+        assert 42 in values
+
+
+class TestAccountSummary:
+    """Tests for the Account Summary sheet."""
+
+    def test_totals_per_account(self, tmp_path: Path) -> None:
+        """Test credits, debits and closing balance are aggregated per account."""
+        transactions = [
+            create_transaction(Decimal("1500.25"), "salary"),
+            create_transaction(Decimal("-20.10"), "dining"),
+            create_transaction(Decimal("-0.15"), "dining"),
+        ]
+        path = write_workbook(tmp_path, transactions)
+
+        ws = load_workbook(path)["Account Summary"]
+        assert [cell.value for cell in ws[2]] == ["Checking", 100, 1500.25, -20.25, 1580]
+        assert ws["A3"].value == "TOTAL"
+        assert ws["B3"].value == "=SUM(B2:B2)"
+
+    def test_sub_cent_amounts_rounded_after_summing(self, tmp_path: Path) -> None:
+        """Test sub-cent amounts are summed exactly and rounded once."""
+        transactions = [create_transaction(Decimal("-0.004"), "dining") for _ in range(3)]
+        path = write_workbook(tmp_path, transactions)
+
+        ws = load_workbook(path)["Account Summary"]
+        assert ws["D2"].value == -0.01
+
+
+class TestMasterList:
+    """Tests for the All Transactions sheet."""
+
+    def test_rows_formulas_and_validation(self, tmp_path: Path) -> None:
+        """Test rows carry per-row formulas and the category dropdown covers them."""
+        transactions = [
+            create_transaction(Decimal("-20.00"), "dining", trans_date=date(2025, 1, 2)),
+            create_transaction(Decimal("1000.00"), "salary", trans_date=date(2025, 1, 1)),
+        ]
+        path = write_workbook(tmp_path, transactions)
+
+        ws = load_workbook(path)["All Transactions"]
+        assert ws.freeze_panes == "A2"
+        assert ws["A2"].value.date() == date(2025, 1, 1)
+        assert ws["A2"].number_format == "yyyy-mm-dd"
+        assert ws["D2"].value == "Salary"
+        assert ws["F3"].value == -20
+        assert ws["F3"].number_format == "[Color10]$#,##0.00_);[Red]($#,##0.00)"
+        assert ws["Q3"].value == "=YEAR(A3)"
+        assert ws.column_dimensions["C"].width == 40
+
+        validations = ws.data_validations.dataValidation
+        assert len(validations) == 1
+        assert str(validations[0].sqref) == "D2:D3"
+
+
+class TestAccountSheets:
+    """Tests for the per-account sheets."""
+
+    def test_opening_balance_row_precedes_transactions(self, tmp_path: Path) -> None:
+        """Test the opening balance row is written before the account's transactions."""
+        path = write_workbook(tmp_path, [create_transaction(Decimal("-5.00"), "dining")])
+
+        ws = load_workbook(path)["Checking"]
+        assert ws["B2"].value == "[Opening Balance]"
+        assert ws["E2"].value == 100
+        assert ws["C2"].fill.fgColor.rgb == "00F5F5F5"
+        assert ws["D3"].value == -5
+        assert ws.max_row == 3
+
+
+class TestCategoryAnalysis:
+    """Tests for the Category Analysis sheet."""
+
+    def test_distinct_categories_and_months(self, tmp_path: Path) -> None:
+        """Test rows and month columns are the sorted distinct labels."""
+        transactions = [
+            create_transaction(Decimal("-10.00"), "dining", trans_date=date(2025, 3, 5)),
+            create_transaction(Decimal("-12.00"), "dining", trans_date=date(2025, 1, 9)),
+            create_transaction(Decimal("-3.00"), None, trans_date=date(2025, 3, 20)),
+        ]
+        path = write_workbook(tmp_path, transactions)
+
+        ws = load_workbook(path)["Category Analysis"]
+        assert [cell.value for cell in ws[1]] == ["Category", "2025-01", "2025-03", "Total"]
+        assert [ws["A2"].value, ws["A3"].value] == ["Dining", "Uncategorized"]
+        assert ws["D3"].value == "=SUM(B3:C3)"
+        assert ws.sheet_format.defaultColWidth == 12
+        assert ws.column_dimensions["A"].width == 25
+        money_format = "$#,##0.00_);[Red]($#,##0.00)"
+        assert {ws[ref].number_format for ref in ("B2", "C2", "B3", "C3", "D3")} == {money_format}
+
+    def test_repeated_values_are_sanitized(self, tmp_path: Path) -> None:
+        """Test memoized sanitization still escapes formula-like values on every row."""
+        transactions = [
+            create_transaction(Decimal("-1.00"), "dining", account_name="=Joint", trans_date=date(2025, 1, d))
+            for d in (1, 2)
+        ]
+        path = write_workbook(tmp_path, transactions)
+
+        ws = load_workbook(path)["All Transactions"]
+        assert [ws["B2"].value, ws["B3"].value] == ["'=Joint", "'=Joint"]
+
+
+class TestEmptyInput:
+    """Tests for writing a workbook with no transactions."""
+
+    def test_header_only_sheets(self, tmp_path: Path) -> None:
+        """Test empty input writes headers only and no per-account sheets."""
+        path = write_workbook(tmp_path, [])
+
+        wb = load_workbook(path)
+        assert "Checking" not in wb.sheetnames
+        for name in ("All Transactions", "Review Queue", "Deposits", "Transfers"):
+            assert wb[name].max_row == 1
+        assert wb["All Transactions"].data_validations.dataValidation == []
+
+
+class TestConfidenceFormatting:
+    """Tests for confidence score colouring."""
+
+    def test_conditional_rules_cover_confidence_columns(self, tmp_path: Path) -> None:
+        """Test confidence columns are coloured by rules rather than per-cell fills."""
+        transactions = [
+            create_transaction(Decimal("-5.00"), "dining"),
+            create_transaction(Decimal("-6.00")),
+        ]
+        path = write_workbook(tmp_path, transactions)
+
+        wb = load_workbook(path)
+        for sheet, column in (("All Transactions", "K"), ("Review Queue", "G")):
+            ws = wb[sheet]
+            ranges = {str(cf.sqref): cf.rules for cf in ws.conditional_formatting}
+            rules = ranges[f"{column}2:{column}3"]
+            assert [rule.dxf.fill.fgColor.rgb for rule in rules] == ["00FFCCCC", "00FFFFCC", "00CCFFCC"]
+            assert all(f"ISNUMBER({column}2)" in rule.formula[0] for rule in rules)
+            assert ws[f"{column}2"].fill.fill_type is None
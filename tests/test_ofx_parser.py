@@ -0,0 +1,99 @@
+"""Tests for OFXParser."""
+
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from financial_consolidator.parsers.ofx_parser import OFXParser, _strip_doctypes
+
+pytest.importorskip("ofxparse")
+
+STATEMENT = """OFXHEADER:100
+DATA:OFXSGML
+VERSION:102
+SECURITY:NONE
+ENCODING:USASCII
+CHARSET:1252
+COMPRESSION:NONE
+OLDFILEUID:NONE
+NEWFILEUID:NONE
+
+<OFX>
+<SIGNONMSGSRSV1><SONRS>
+<STATUS><CODE>0<SEVERITY>INFO</STATUS>
+<DTSERVER>20250131<LANGUAGE>ENG
+<FI><ORG>Test Bank<FID>1234</FI>
+</SONRS></SIGNONMSGSRSV1>
+<BANKMSGSRSV1><STMTTRNRS>
+<TRNUID>1<STATUS><CODE>0<SEVERITY>INFO</STATUS>
+<STMTRS><CURDEF>USD
+<BANKACCTFROM><BANKID>123<ACCTID>456<ACCTTYPE>CHECKING</BANKACCTFROM>
+<BANKTRANLIST><DTSTART>20250101<DTEND>20250131
+<STMTTRN><TRNTYPE>DEBIT<DTPOSTED>20250102<TRNAMT>-3.50<FITID>1<NAME>Coffee</STMTTRN>
+<STMTTRN><TRNTYPE>CREDIT<DTPOSTED>20250103<TRNAMT>2500.00<FITID>2<NAME>Paycheck</STMTTRN>
+</BANKTRANLIST>
+</STMTRS></STMTTRNRS></BANKMSGSRSV1>
+</OFX>
+"""
+
+
+class TestParse:
+    """Tests for OFXParser.parse and detect_institution."""
+
+    def test_parse_and_detect_share_one_parse(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the parsed document is reused until the file changes."""
+        path = tmp_path / "statement.ofx"
+        path.write_text(STATEMENT, encoding="ascii")
+        calls: list[object] = []
+        from ofxparse import OfxParser
+
+        lib_parse = OfxParser.parse
+
+        def counting_parse(*args: object, **kwargs: object) -> object:
+            calls.append(args)
+            return lib_parse(*args, **kwargs)
+
+        monkeypatch.setattr(OfxParser, "parse", counting_parse)
+        parser = OFXParser()
+
+        assert parser.detect_institution(path) == "Test Bank"
+        transactions = parser.parse(path)
+        assert len(calls) == 1
+
+        assert [(t.description, t.amount) for t in transactions] == [
+            ("Coffee", Decimal("-3.50")),
+            ("Paycheck", Decimal("2500.00")),
+        ]
+
+        path.write_text(STATEMENT.replace("Coffee", "Tea"), encoding="ascii")
+        assert parser.parse(path)[0].description == "Tea"
+        assert len(calls) == 2
+
+    def test_can_parse_single_line_export(self, tmp_path: Path) -> None:
+        """Test the header is found in files without line breaks."""
+        path = tmp_path / "statement.qfx"
+        path.write_text(STATEMENT.replace("\n", ""), encoding="ascii")
+        other = tmp_path / "other.ofx"
+        other.write_text("Date,Description,Amount\n", encoding="ascii")
+
+        assert OFXParser().can_parse(path)
+        assert not OFXParser().can_parse(other)
+
+
+class TestStripDoctypes:
+    """Tests for DOCTYPE removal before ofxparse sees the content."""
+
+    def test_declarations_removed(self) -> None:
+        """Test every terminated DOCTYPE is removed, whatever its case."""
+        content = b'<!DOCTYPE ofx SYSTEM "file:///etc/passwd"><OFX><!doctype\nx></OFX>'
+
+        assert _strip_doctypes(content) == b"<OFX></OFX>"
+
+    def test_unchanged_content_not_copied(self) -> None:
+        """Test content without a complete declaration is returned as is."""
+        content = b"<OFX>" + b"<!DOCTYPE " * 50_000
+
+        assert _strip_doctypes(content) is content
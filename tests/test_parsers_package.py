@@ -0,0 +1,39 @@
+"""Tests for the lazy exports of the parsers package."""
+
+import subprocess
+import sys
+
+import pytest
+
+import financial_consolidator.parsers as parsers
+
+
+class TestLazyExports:
+    """Tests for PEP 562 lazy imports in financial_consolidator.parsers."""
+
+    def test_parse_error_does_not_load_parsers(self) -> None:
+        """Test importing ParseError leaves the format parsers unimported."""
+        code = (
+            "import sys\n"
+            "from financial_consolidator.parsers import ParseError\n"
+            "loaded = [m for m in ('financial_consolidator.parsers.pdf_parser',"
+            " 'financial_consolidator.parsers.excel_parser', 'openpyxl') if m in sys.modules]\n"
+            "print(','.join(loaded))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == ""
+
+    def test_all_names_resolve(self) -> None:
+        """Test every name in __all__ resolves to its defining module's object."""
+        from financial_consolidator.parsers.detector import FileDetector
+
+        for name in parsers.__all__:
+            assert getattr(parsers, name) is not None
+        assert parsers.FileDetector is FileDetector
+
+    def test_unknown_name_raises(self) -> None:
+        """Test unknown attributes still raise AttributeError."""
+        with pytest.raises(AttributeError):
+            parsers.NoSuchParser  # noqa: B018
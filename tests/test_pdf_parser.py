@@ -0,0 +1,98 @@
+"""Tests for PDFParser helpers."""
+
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from financial_consolidator.parsers.base import ParseError
+from financial_consolidator.parsers.detector import FileDetector
+from financial_consolidator.parsers.pdf_parser import PDFParser
+
+
+def write_text_pdf(path: Path, text: str) -> Path:
+    """Helper to write a one-page PDF holding a single line of text and no tables."""
+    content = f"BT /F1 12 Tf 50 750 Td ({text}) Tj ET".encode()
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [4 0 R] /Count 1 >>",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents 5 0 R"
+        b" /Resources << /Font << /F1 3 0 R >> >> >>",
+        b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content), content),
+    ]
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, obj in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, obj)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1, xref
+    )
+    path.write_bytes(bytes(out))
+    return path
+
+
+class TestParseTable:
+    """Tests for PDFParser._parse_table."""
+
+    def test_header_found_and_mapping_reused(self) -> None:
+        """Test the header below a title row is mapped once for repeated tables."""
+        table: list[list[str | None]] = [
+            ["Account Activity", None, None, None],
+            ["Posted", "Details", "Withdrawals", "Deposits"],
+            ["01/02/2025", "Coffee", "3.50", None],
+            ["01/03/2025", "Paycheck", None, "2,500.00"],
+        ]
+        parser = PDFParser()
+
+        first, _ = parser._parse_table(table, "s.pdf", 1, 1)
+        second, _ = parser._parse_table(table, "s.pdf", 2, 1)
+
+        assert [(t.description, t.amount) for t in first] == [
+            ("Coffee", Decimal("-3.50")),
+            ("Paycheck", Decimal("2500.00")),
+        ]
+        assert [t.raw_data["page_num"] for t in second if t.raw_data] == [2, 2]
+        assert first[0].raw_data is not None
+        assert first[0].raw_data["row"] is table[2]
+        assert len(parser._mapping_cache) == 1
+
+
+class TestCanParse:
+    """Tests for PDFParser.can_parse."""
+
+    def test_signature_checked_without_extracting(self, tmp_path: Path) -> None:
+        """Test the %PDF- header decides can_parse."""
+        pdf = tmp_path / "statement.pdf"
+        pdf.write_bytes(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+        renamed = tmp_path / "notes.pdf"
+        renamed.write_text("Date,Description,Amount\n", encoding="utf-8")
+        parser = PDFParser()
+
+        assert parser.can_parse(pdf)
+        assert not parser.can_parse(renamed)
+        assert not parser.can_parse(tmp_path / "missing.pdf")
+
+
+class TestParse:
+    """Tests for PDFParser.parse."""
+
+    def test_pdf_without_tables_is_a_parse_error(self, tmp_path: Path) -> None:
+        """Test a text-only PDF is accepted by can_parse and fails in parse."""
+        pytest.importorskip("pdfplumber")
+        path = write_text_pdf(tmp_path / "letter.pdf", "Thank you for banking with us")
+        parser = PDFParser()
+
+        assert parser.can_parse(path)
+        with pytest.raises(ParseError, match="No tables found in PDF file"):
+            parser.parse(path)
+
+        _, parsed, errors = FileDetector().parse_directory(tmp_path)
+        assert parsed == []
+        assert errors == ["letter.pdf: No tables found in PDF file"]
+        with pytest.raises(ParseError, match="No tables found"):
+            FileDetector().parse_directory(tmp_path, strict=True)
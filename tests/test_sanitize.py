@@ -0,0 +1,23 @@
+"""Tests for spreadsheet formula-injection sanitization."""
+
+import pytest
+
+from financial_consolidator.utils.sanitize import sanitize_for_csv
+
+
+class TestSanitizeForCsv:
+    """Tests for sanitize_for_csv."""
+
+    @pytest.mark.parametrize("value", ["=1+1", "+1", "-1", "@SUM(A1)", "\tx", "\rx", "\nx", "|cmd"])
+    def test_formula_triggers_are_prefixed(self, value: str) -> None:
+        """Test values starting with a formula trigger get a leading quote."""
+        assert sanitize_for_csv(value) == "'" + value
+
+    @pytest.mark.parametrize("value", ["Coffee", "1=1", "a-b", "'quoted", ""])
+    def test_safe_values_unchanged(self, value: str) -> None:
+        """Test values without a leading trigger are returned as-is."""
+        assert sanitize_for_csv(value) == value
+
+    def test_none_passthrough(self) -> None:
+        """Test None is returned unchanged."""
+        assert sanitize_for_csv(None) is None